@@ -1276,15 +1276,19 @@ router.get('/history/:user_id',
 );
 
 // Route: POST /api/verify/live-capture
+// Accepts the image either as a base64 `live_image_data` field or, to avoid
+// the base64 overhead, as a multipart `live_image` file
 router.post('/live-capture',
   authenticateAPIKey,
   checkSandboxMode,
   verificationRateLimit,
+  upload.single('live_image'),
   [
     body('verification_id')
       .isUUID()
       .withMessage('Verification ID must be a valid UUID'),
     body('live_image_data')
+      .if((value: any, { req }: any) => !req.file)
       .isBase64()
       .withMessage('Live image data must be valid base64'),
     body('challenge_response')
@@ -1303,6 +1307,7 @@ router.post('/live-capture',
     }
     
     const { verification_id, live_image_data, challenge_response } = req.body;
+    const liveImageFile = req.file;
     
     // Get verification request
     const verificationRequest = await verificationService.getVerificationRequest(verification_id);
@@ -1322,17 +1327,23 @@ router.post('/live-capture',
     logVerificationEvent('live_capture_started', verification_id, {
       userId: verificationRequest.user_id,
       challengeProvided: !!challenge_response,
-      dataSize: live_image_data?.length || 0
+      dataSize: liveImageFile?.size || live_image_data?.length || 0
     });
     
-    // Validate live_image_data exists and is not empty
-    if (!live_image_data || typeof live_image_data !== 'string' || live_image_data.trim() === '') {
+    if (liveImageFile) {
+      // Live captures must be image files — no PDFs
+      const liveImageTypeCheck = await validateFileType(liveImageFile.buffer, ['image/jpeg', 'image/png']);
+      if (!liveImageTypeCheck.valid) {
+        throw new FileUploadError(liveImageTypeCheck.reason || 'Live image must be a JPEG or PNG image');
+      }
+    } else if (!live_image_data || typeof live_image_data !== 'string' || live_image_data.trim() === '') {
+      // Validate live_image_data exists and is not empty
       throw new ValidationError('Live image data is required and must be a non-empty string', 'live_image_data', live_image_data);
     }
 
     try {
-      // Convert base64 to buffer
-      const imageBuffer = Buffer.from(live_image_data, 'base64');
+      // Use the uploaded file as-is, or convert base64 to buffer
+      const imageBuffer = liveImageFile ? liveImageFile.buffer : Buffer.from(live_image_data, 'base64');
       
       // Store live capture image
       const liveCaptureId = crypto.randomUUID();
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Async usage examples for the Idswyft Python SDK
+
+Requires the async extra: pip install "idswyft[async]"
+"""
+
+import asyncio
+import os
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import idswyft
+from idswyft import IdswyftError
+
+
+async def basic_document_verification(client):
+    """Example 1: Basic document verification"""
+    try:
+        result = await client.verify_document(
+            document_type="passport",
+            document_file="examples/sample-passport.jpg",
+            user_id="user-12345",
+            metadata={"source": "python_async_example"}
+        )
+
+        print(f"✓ Document verification initiated: {result['id']} ({result['status']})")
+        return result
+
+    except IdswyftError as e:
+        print(f"✗ Verification failed: {e.message}")
+        return None
+
+
+async def list_verifications_example(client):
+    """Example 2: List recent verifications"""
+    try:
+        response = await client.list_verifications(limit=10)
+        print(f"✓ Found {response['total']} total verifications")
+        return response
+
+    except IdswyftError as e:
+        print(f"✗ Failed to list verifications: {e.message}")
+        return None
+
+
+async def usage_statistics_example(client):
+    """Example 3: Get usage statistics"""
+    try:
+        stats = await client.get_usage_stats()
+        print(f"✓ Monthly usage: {stats['monthly_usage']}/{stats['monthly_limit']}")
+        return stats
+
+    except IdswyftError as e:
+        print(f"✗ Failed to get usage stats: {e.message}")
+        return None
+
+
+async def main():
+    """Run the examples concurrently on one client"""
+    print("Idswyft Python SDK Async Examples")
+    print("=" * 50)
+
+    api_key = os.environ.get("IDSWYFT_API_KEY")
+    if not api_key:
+        print("⚠️ Set IDSWYFT_API_KEY environment variable to run examples")
+        print("export IDSWYFT_API_KEY='your-api-key-here'")
+        return
+
+    # All three requests are in flight at once over the client's
+    # connection pool instead of waiting on each other
+    async with idswyft.IdswyftAsyncClient(api_key=api_key, sandbox=True) as client:
+        await asyncio.gather(
+            basic_document_verification(client),
+            list_verifications_example(client),
+            usage_statistics_example(client),
+        )
+
+    print(f"\n{'='*50}")
+    print("✓ All examples completed!")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
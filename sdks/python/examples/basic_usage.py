@@ -3,9 +3,15 @@
 Basic usage examples for the Idswyft Python SDK
 """
 
+import hashlib
+import hmac
+import json
 import os
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from http.server import BaseHTTPRequestHandler, HTTPServer
 from pathlib import Path
 
 # Add parent directory to path for imports
@@ -14,251 +20,290 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 import idswyft
 from idswyft import IdswyftError, IdswyftAuthenticationError
 
+# Resolve the API key once; main() refuses to run without it
+_API_KEY = os.environ.get("IDSWYFT_API_KEY")
 
-def basic_document_verification():
+_STATUS_EMOJI = {
+    'verified': '✅',
+    'failed': '❌',
+    'pending': '⏳',
+    'manual_review': '👥'
+}
+_EMOJI_GET = _STATUS_EMOJI.get
+
+
+def _timed_call(label, fn, *args, _out=None, **kwargs):
+    """Call an SDK method and report how long the request took
+
+    Uses time.monotonic() so the measurement isn't skewed by wall-clock
+    adjustments, and starts the clock right before the call so only the
+    request itself is measured. The timing line is appended to ``_out``
+    when given, otherwise printed straight away.
+    """
+    started = time.monotonic()
+    try:
+        return fn(*args, **kwargs)
+    finally:
+        line = f"  [{label}] {(time.monotonic() - started) * 1e3:.1f} ms"
+        if _out is None:
+            print(line)
+        else:
+            _out.append(line)
+
+
+def _flush(out):
+    """Write an example's buffered output in one call
+
+    Keeps each example's block together when examples run in parallel and
+    avoids a write per line when stdout is piped to a file.
+    """
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def basic_document_verification(client):
     """Example 1: Basic document verification"""
-    print("=== Example 1: Basic Document Verification ===")
-    
-    client = idswyft.IdswyftClient(
-        api_key=os.getenv("IDSWYFT_API_KEY", "your-api-key"),
-        sandbox=True
-    )
+    out = ["=== Example 1: Basic Document Verification ==="]
     
     try:
-        # Using file path
-        result = client.verify_document(
-            document_type="passport",
-            document_file="examples/sample-passport.jpg",  # Sample file
-            user_id="user-12345",
-            metadata={
-                "session_id": "sess_abc123",
-                "source": "python_example"
-            }
-        )
+        # Pass an open file so the upload is streamed from disk rather
+        # than loaded into memory first
+        with open("examples/sample-passport.jpg", "rb") as document:  # Sample file
+            result = _timed_call("verify_document", client.verify_document, _out=out,
+                document_type="passport",
+                document_file=document,
+                user_id="user-12345",
+                metadata={
+                    "session_id": "sess_abc123",
+                    "source": "python_example"
+                }
+            )
         
-        print(f"✓ Document verification initiated")
-        print(f"  ID: {result['id']}")
-        print(f"  Status: {result['status']}")
-        print(f"  Type: {result['type']}")
-        print(f"  Created: {result['created_at']}")
+        out.append(f"✓ Document verification initiated")
+        out.append(f"  ID: {result['id']}")
+        out.append(f"  Status: {result['status']}")
+        out.append(f"  Type: {result['type']}")
+        out.append(f"  Created: {result['created_at']}")
         
         if result.get('confidence_score'):
-            print(f"  Confidence: {result['confidence_score']:.2f}")
+            out.append(f"  Confidence: {result['confidence_score']:.2f}")
         
         # Display AI analysis results
         if result.get('ocr_data'):
             ocr = result['ocr_data']
-            print("  OCR Analysis:")
-            if ocr.get('name'): print(f"    Name: {ocr['name']}")
-            if ocr.get('date_of_birth'): print(f"    DOB: {ocr['date_of_birth']}")
-            if ocr.get('document_number'): print(f"    Doc Number: {ocr['document_number']}")
+            out.append("  OCR Analysis:")
+            if ocr.get('name'): out.append(f"    Name: {ocr['name']}")
+            if ocr.get('date_of_birth'): out.append(f"    DOB: {ocr['date_of_birth']}")
+            if ocr.get('document_number'): out.append(f"    Doc Number: {ocr['document_number']}")
             if ocr.get('confidence_scores'):
-                print(f"    Confidence Scores: {ocr['confidence_scores']}")
+                out.append(f"    Confidence Scores: {ocr['confidence_scores']}")
         
         if result.get('quality_analysis'):
             quality = result['quality_analysis']
-            print("  Quality Analysis:")
-            print(f"    Overall Quality: {quality['overallQuality']}")
-            print(f"    Is Blurry: {quality['isBlurry']}")
+            out.append("  Quality Analysis:")
+            out.append(f"    Overall Quality: {quality['overallQuality']}")
+            out.append(f"    Is Blurry: {quality['isBlurry']}")
             if quality.get('resolution'):
                 res = quality['resolution']
-                print(f"    Resolution: {res['width']}x{res['height']}")
+                out.append(f"    Resolution: {res['width']}x{res['height']}")
             if quality.get('issues'):
-                print(f"    Issues: {quality['issues']}")
+                out.append(f"    Issues: {quality['issues']}")
             if quality.get('recommendations'):
-                print(f"    Recommendations: {quality['recommendations']}")
+                out.append(f"    Recommendations: {quality['recommendations']}")
         
         return result
         
     except IdswyftError as e:
-        print(f"✗ Verification failed: {e.message}")
+        out.append(f"✗ Verification failed: {e.message}")
         if hasattr(e, 'details'):
-            print(f"  Details: {e.details}")
+            out.append(f"  Details: {e.details}")
         return None
+        
+    finally:
+        _flush(out)
 
 
-def selfie_verification_example():
+def selfie_verification_example(client):
     """Example 2: Selfie verification with document matching"""
-    print("\n=== Example 2: Selfie Verification ===")
-    
-    client = idswyft.IdswyftClient(
-        api_key=os.getenv("IDSWYFT_API_KEY", "your-api-key"),
-        sandbox=True
-    )
+    out = ["\n=== Example 2: Selfie Verification ==="]
     
     try:
         # First verify a document
-        print("Step 1: Verifying document...")
-        doc_result = client.verify_document(
-            document_type="drivers_license",
-            document_file="examples/sample-license.jpg",
-            user_id="user-67890"
-        )
+        out.append("Step 1: Verifying document...")
+        with open("examples/sample-license.jpg", "rb") as document:
+            doc_result = _timed_call("verify_document", client.verify_document, _out=out,
+                document_type="drivers_license",
+                document_file=document,
+                user_id="user-67890"
+            )
         
-        print(f"✓ Document verified with ID: {doc_result['id']}")
+        out.append(f"✓ Document verified with ID: {doc_result['id']}")
         
         # Then verify selfie against the document
-        print("Step 2: Verifying selfie...")
-        selfie_result = client.verify_selfie(
-            selfie_file="examples/sample-selfie.jpg",
-            reference_document_id=doc_result['id'],
-            user_id="user-67890",
-            webhook_url="https://yourapp.com/webhook"
-        )
+        out.append("Step 2: Verifying selfie...")
+        with open("examples/sample-selfie.jpg", "rb") as selfie:
+            selfie_result = _timed_call("verify_selfie", client.verify_selfie, _out=out,
+                selfie_file=selfie,
+                reference_document_id=doc_result['id'],
+                user_id="user-67890",
+                webhook_url="https://yourapp.com/webhook"
+            )
         
-        print(f"✓ Selfie verification initiated")
-        print(f"  ID: {selfie_result['id']}")
-        print(f"  Status: {selfie_result['status']}")
+        out.append(f"✓ Selfie verification initiated")
+        out.append(f"  ID: {selfie_result['id']}")
+        out.append(f"  Status: {selfie_result['status']}")
         
         # Display face matching and liveness results
         if selfie_result.get('face_match_score') is not None:
-            print(f"  Face Match Score: {selfie_result['face_match_score']:.3f}")
+            out.append(f"  Face Match Score: {selfie_result['face_match_score']:.3f}")
         if selfie_result.get('liveness_score') is not None:
-            print(f"  Liveness Score: {selfie_result['liveness_score']:.3f}")
+            out.append(f"  Liveness Score: {selfie_result['liveness_score']:.3f}")
         if selfie_result.get('manual_review_reason'):
-            print(f"  Manual Review Reason: {selfie_result['manual_review_reason']}")
+            out.append(f"  Manual Review Reason: {selfie_result['manual_review_reason']}")
         
         return {"document": doc_result, "selfie": selfie_result}
         
     except IdswyftError as e:
-        print(f"✗ Selfie verification failed: {e.message}")
+        out.append(f"✗ Selfie verification failed: {e.message}")
         return None
+        
+    finally:
+        _flush(out)
+
 
+def monitor_verification_status(client, verification_id, max_wait=120):
+    """Example 3: Monitor verification status until completion
 
-def monitor_verification_status(verification_id):
-    """Example 3: Monitor verification status until completion"""
+    wait_for_completion polls with exponential backoff and honours
+    Retry-After, so slow verifications cost fewer requests against the
+    rate limit while fast ones are picked up on the first or second check.
+    """
     print(f"\n=== Example 3: Monitoring Status for {verification_id} ===")
     
-    client = idswyft.IdswyftClient(
-        api_key=os.getenv("IDSWYFT_API_KEY", "your-api-key"),
-        sandbox=True
-    )
-    
-    max_attempts = 10
-    poll_interval = 3  # seconds
-    
-    for attempt in range(1, max_attempts + 1):
-        try:
-            verification = client.get_verification_status(verification_id)
-            status = verification["status"]
-            
-            print(f"  Attempt {attempt}: Status = {status}")
-            
-            if status in ["verified", "failed", "manual_review"]:
-                print("✓ Verification completed!")
-                print(f"  Final Status: {status}")
-                if verification.get('confidence_score'):
-                    print(f"  Confidence Score: {verification['confidence_score']:.2f}")
-                return verification
-            
-            if attempt < max_attempts:
-                print(f"  Waiting {poll_interval} seconds...")
-                time.sleep(poll_interval)
-                
-        except IdswyftError as e:
-            print(f"✗ Status check failed: {e.message}")
-            if attempt == max_attempts:
-                raise
+    try:
+        verification = _timed_call("wait_for_completion", client.wait_for_completion,
+            verification_id, timeout=max_wait)
+    except idswyft.IdswyftTimeoutError:
+        print("⚠️ Monitoring timed out")
+        return None
+    except IdswyftError as e:
+        print(f"✗ Status check failed: {e.message}")
+        raise
     
-    print("⚠️ Monitoring timed out")
-    return None
+    print("✓ Verification completed!")
+    print(f"  Final Status: {verification['status']}")
+    if verification.get('confidence_score'):
+        print(f"  Confidence Score: {verification['confidence_score']:.2f}")
+    return verification
 
 
-def list_verifications_example():
+def list_verifications_example(client):
     """Example 4: List and filter verifications"""
-    print("\n=== Example 4: List Verifications ===")
-    
-    client = idswyft.IdswyftClient(
-        api_key=os.getenv("IDSWYFT_API_KEY", "your-api-key"),
-        sandbox=True
-    )
+    out = ["\n=== Example 4: List Verifications ==="]
     
     try:
         # List recent verifications
-        response = client.list_verifications(limit=10)
+        response = _timed_call("list_verifications", client.list_verifications, limit=10, _out=out)
         
-        print(f"✓ Found {response['total']} total verifications")
-        print(f"  Showing {len(response['verifications'])} results")
+        out.append(f"✓ Found {response['total']} total verifications")
+        out.append(f"  Showing {len(response['verifications'])} results")
         
         for verification in response['verifications']:
-            status_emoji = {
-                'verified': '✅',
-                'failed': '❌', 
-                'pending': '⏳',
-                'manual_review': '👥'
-            }.get(verification['status'], '❓')
-            
-            print(f"  {status_emoji} {verification['id'][:20]}... | {verification['status']} | {verification['type']}")
+            status = verification.get('status')
+            out.append(
+                f"  {_EMOJI_GET(status, '❓')} {verification['id'][:20]}... | {status} | {verification.get('type')}"
+            )
         
-        # Filter by status
-        print("\nFiltering by 'verified' status...")
-        verified_response = client.list_verifications(status="verified", limit=5)
-        print(f"✓ Found {verified_response['total']} verified verifications")
+        # Filter the page we already have rather than making a second
+        # round trip just to narrow it by status
+        verified = [v for v in response['verifications'] if v['status'] == 'verified'][:5]
+        out.append(f"✓ {len(verified)} of these are verified")
         
         return response
         
     except IdswyftError as e:
-        print(f"✗ Failed to list verifications: {e.message}")
+        out.append(f"✗ Failed to list verifications: {e.message}")
         return None
+        
+    finally:
+        _flush(out)
 
 
-def usage_statistics_example():
+def usage_statistics_example(client):
     """Example 5: Get usage statistics"""
-    print("\n=== Example 5: Usage Statistics ===")
-    
-    client = idswyft.IdswyftClient(
-        api_key=os.getenv("IDSWYFT_API_KEY", "your-api-key"),
-        sandbox=True
-    )
+    out = ["\n=== Example 5: Usage Statistics ==="]
     
     try:
-        stats = client.get_usage_stats()
+        stats = _timed_call("get_usage_stats", client.get_usage_stats, _out=out)
         
-        print("✓ Usage Statistics:")
-        print(f"  Period: {stats['period']}")
-        print(f"  Total Requests: {stats['total_requests']}")
-        print(f"  Success Rate: {stats['success_rate']}")
-        print(f"  Monthly Usage: {stats['monthly_usage']}/{stats['monthly_limit']}")
-        print(f"  Remaining Quota: {stats['remaining_quota']}")
-        print(f"  Quota Resets: {stats['quota_reset_date']}")
+        out.append("✓ Usage Statistics:")
+        out.append(f"  Period: {stats['period']}")
+        out.append(f"  Total Requests: {stats['total_requests']}")
+        out.append(f"  Success Rate: {stats['success_rate']}")
+        out.append(f"  Monthly Usage: {stats['monthly_usage']}/{stats['monthly_limit']}")
+        out.append(f"  Remaining Quota: {stats['remaining_quota']}")
+        out.append(f"  Quota Resets: {stats['quota_reset_date']}")
         
         # Calculate usage percentage
         usage_pct = (stats['monthly_usage'] / stats['monthly_limit']) * 100
         if usage_pct > 80:
-            print(f"  ⚠️ Warning: {usage_pct:.1f}% of quota used")
+            out.append(f"  ⚠️ Warning: {usage_pct:.1f}% of quota used")
         elif usage_pct > 90:
-            print(f"  🚨 Alert: {usage_pct:.1f}% of quota used!")
+            out.append(f"  🚨 Alert: {usage_pct:.1f}% of quota used!")
         
         return stats
         
     except IdswyftError as e:
-        print(f"✗ Failed to get usage stats: {e.message}")
+        out.append(f"✗ Failed to get usage stats: {e.message}")
         return None
+        
+    finally:
+        _flush(out)
 
 
 def webhook_verification_example():
     """Example 6: Webhook signature verification"""
-    print("\n=== Example 6: Webhook Signature Verification ===")
+    out = ["\n=== Example 6: Webhook Signature Verification ==="]
     
     # Simulate webhook payload
     webhook_payload = '''{"verification_id":"verif_123","status":"verified","confidence_score":0.95}'''
-    webhook_signature = "sha256=abcd1234..."  # This would come from the webhook header
     webhook_secret = "your-webhook-secret"
     
+    # Simulate the X-Idswyft-Signature header: the server signs the raw
+    # body with HMAC-SHA256 and sends it as "sha256=<hex digest>"
+    webhook_signature = "sha256=" + hmac.new(
+        webhook_secret.encode("utf-8"),
+        webhook_payload.encode("utf-8"),
+        hashlib.sha256
+    ).hexdigest()
+    
     # Verify signature
     is_valid = idswyft.IdswyftClient.verify_webhook_signature(
         payload=webhook_payload,
-        signature=webhook_signature, 
+        signature=webhook_signature,
         secret=webhook_secret
     )
     
     if is_valid:
-        print("✓ Webhook signature is valid")
-        print("  Safe to process webhook payload")
+        out.append("✓ Webhook signature is valid")
+        out.append("  Safe to process webhook payload")
     else:
-        print("✗ Invalid webhook signature")
-        print("  Do not trust this payload")
+        out.append("✗ Invalid webhook signature")
+        out.append("  Do not trust this payload")
+    
+    # Without the SDK, do the same thing by hand: compute the HMAC once and
+    # compare with hmac.compare_digest, never ==, so the comparison time
+    # doesn't leak how many leading characters matched. hashlib is backed
+    # by OpenSSL, which uses the CPU's SHA extensions when available, so
+    # there is nothing to gain from a third-party SHA-256 package.
+    expected = "sha256=" + hmac.new(
+        webhook_secret.encode("utf-8"),
+        webhook_payload.encode("utf-8"),
+        hashlib.sha256
+    ).hexdigest()
+    if hmac.compare_digest(expected, webhook_signature):
+        out.append("✓ Manual check agrees")
     
+    _flush(out)
     return is_valid
 
 
@@ -272,11 +317,21 @@ def error_handling_example():
         sandbox=True
     )
     
+    document_path = "nonexistent.jpg"
+    
     try:
+        # Validate inputs locally before calling the API; a missing file
+        # is reported right away instead of surfacing from the upload
+        if not Path(document_path).exists():
+            raise idswyft.IdswyftValidationError(
+                message=f"File not found: {document_path}",
+                field="document_file"
+            )
+        
         # This should fail with authentication error
-        client.verify_document(
+        _timed_call("verify_document", client.verify_document,
             document_type="passport",
-            document_file="nonexistent.jpg"
+            document_file=document_path
         )
         
     except IdswyftAuthenticationError as e:
@@ -307,31 +362,136 @@ def error_handling_example():
         print(f"✗ Unexpected error: {e}")
 
 
+def webhook_completion_example(client, webhook_url, fallback_after=300):
+    """Example 8: Wait for completion via webhook instead of polling
+
+    Starts a small HTTP server that receives the verification webhook and
+    wakes the caller as soon as a signed, terminal status arrives. Unlike
+    polling, nothing is sent to the API while the verification is pending.
+
+    Production integrations usually combine both: rely on the webhook and
+    only fall back to polling if no event has arrived after a few minutes
+    (e.g. because the receiver was down during delivery). This example does
+    the same via ``fallback_after``.
+
+    ``webhook_url`` must be publicly reachable and forward to the local port
+    given by ``IDSWYFT_WEBHOOK_PORT`` (default 8080), e.g. through a tunnel.
+    """
+    print("\n=== Example 8: Webhook-Driven Completion ===")
+    
+    webhook_secret = os.getenv("IDSWYFT_WEBHOOK_SECRET", "your-webhook-secret")
+    port = int(os.getenv("IDSWYFT_WEBHOOK_PORT", "8080"))
+    
+    # Terminal events by verification ID; other verifications' webhooks can
+    # arrive too, so the waiter checks for its own ID each time it is woken
+    arrived = threading.Condition()
+    events = {}
+    
+    class WebhookHandler(BaseHTTPRequestHandler):
+        def do_POST(self):
+            length = int(self.headers.get("Content-Length", 0))
+            payload = self.rfile.read(length)
+            signature = self.headers.get("X-Idswyft-Signature", "")
+            
+            # Never trust a webhook body before checking its signature
+            if not idswyft.IdswyftClient.verify_webhook_signature(payload, signature, webhook_secret):
+                self.send_response(401)
+                self.end_headers()
+                return
+            
+            event = json.loads(payload)
+            self.send_response(200)
+            self.end_headers()
+            
+            if event.get("status") in ["verified", "failed", "manual_review"]:
+                with arrived:
+                    events[event.get("verification_id")] = event
+                    arrived.notify_all()
+        
+        def log_message(self, format, *args):
+            pass
+    
+    server = HTTPServer(("", port), WebhookHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    print(f"  Listening for webhooks on port {port}")
+    
+    try:
+        with open("examples/sample-passport.jpg", "rb") as document:
+            result = _timed_call("verify_document", client.verify_document,
+                document_type="passport",
+                document_file=document,
+                user_id="user-12345",
+                webhook_url=webhook_url
+            )
+        verification_id = result['id']
+        print(f"✓ Document submitted: {verification_id}")
+        
+        with arrived:
+            received = arrived.wait_for(lambda: verification_id in events, timeout=fallback_after)
+        if received:
+            event = events[verification_id]
+            print("✓ Webhook received")
+            print(f"  Final Status: {event['status']}")
+            return event
+        
+        print(f"⚠️ No webhook after {fallback_after}s, falling back to polling")
+        return monitor_verification_status(client, verification_id)
+        
+    except IdswyftError as e:
+        print(f"✗ Verification failed: {e.message}")
+        return None
+        
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
 def main():
     """Run all examples"""
     print("Idswyft Python SDK Examples")
     print("=" * 50)
     
     # Check if API key is set
-    if not os.getenv("IDSWYFT_API_KEY"):
+    if not _API_KEY:
         print("⚠️ Set IDSWYFT_API_KEY environment variable to run examples")
         print("export IDSWYFT_API_KEY='your-api-key-here'")
         return
     
+    # One client for all examples so they share its connection pool
+    # instead of paying a fresh TCP/TLS handshake each time
+    client = idswyft.IdswyftClient(
+        api_key=_API_KEY,
+        sandbox=True
+    )
+    
     try:
         # Run examples
-        doc_result = basic_document_verification()
-        selfie_results = selfie_verification_example()
+        doc_result = basic_document_verification(client)
+        selfie_results = selfie_verification_example(client)
         
         # Monitor status if we have a verification ID
         if doc_result:
-            monitor_verification_status(doc_result['id'])
+            monitor_verification_status(client, doc_result['id'])
+        
+        # These examples are independent of each other and mostly wait on
+        # the network, so run them in parallel on the shared client
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(list_verifications_example, client),
+                executor.submit(usage_statistics_example, client),
+                executor.submit(webhook_verification_example),
+            ]
+            for future in as_completed(futures):
+                future.result()
         
-        list_verifications_example()
-        usage_statistics_example()
-        webhook_verification_example()
         error_handling_example()
         
+        # Webhook delivery needs a publicly reachable URL, so only run
+        # this example when one is configured
+        webhook_url = os.getenv("IDSWYFT_WEBHOOK_URL")
+        if webhook_url:
+            webhook_completion_example(client, webhook_url)
+        
         print(f"\n{'='*50}")
         print("✓ All examples completed!")
         
@@ -339,6 +499,8 @@ def main():
         print("\n⚠️ Examples interrupted by user")
     except Exception as e:
         print(f"\n✗ Example execution failed: {e}")
+    finally:
+        client.close()
 
 
 if __name__ == "__main__":
@@ -4,7 +4,9 @@ Idswyft Python SDK
 Official Python SDK for the Idswyft identity verification platform.
 """
 
-from .client import IdswyftClient
+import platform as _platform
+from typing import TYPE_CHECKING, Any, List
+
 from .exceptions import (
     IdswyftError,
     IdswyftAPIError,
@@ -12,6 +14,7 @@ from .exceptions import (
     IdswyftValidationError,
     IdswyftNetworkError,
     IdswyftRateLimitError,
+    IdswyftTimeoutError,
 )
 from .types import (
     VerificationResult,
@@ -26,22 +29,63 @@ from .types import (
     QualityAnalysisFileSize,
 )
 
-# Convenience imports
-Idswyft = IdswyftClient
+if TYPE_CHECKING:
+    from .client import IdswyftClient
+    from .async_client import IdswyftAsyncClient
+
+    Idswyft = IdswyftClient
+    AsyncIdswyftClient = IdswyftAsyncClient
+
+# The clients pull in requests/httpx, so they are only imported on first
+# access (PEP 562). Scripts that just need the exceptions or types, or a
+# short-lived process, don't pay for the HTTP stack at import time.
+_LAZY = {
+    "IdswyftClient": (".client", "IdswyftClient"),
+    "IdswyftAsyncClient": (".async_client", "IdswyftAsyncClient"),
+    # Convenience imports
+    "Idswyft": (".client", "IdswyftClient"),
+    "AsyncIdswyftClient": (".async_client", "IdswyftAsyncClient"),
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY:
+        import importlib
+
+        module, attr = _LAZY[name]
+        value = getattr(importlib.import_module(module, __name__), attr)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-__version__ = "1.0.0"
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(_LAZY))
+
+
+__version__ = "2.0.0"
 __author__ = "Idswyft Team"
 __email__ = "support@idswyft.com"
 
+# Built once at import; every client sends the same value
+USER_AGENT = (
+    f"idswyft-python/{__version__} python/{_platform.python_version()} "
+    f"{_platform.system()}/{_platform.release()}"
+)
+
 __all__ = [
     "IdswyftClient",
+    "IdswyftAsyncClient",
+    "USER_AGENT",
     "Idswyft",
+    "AsyncIdswyftClient",
     "IdswyftError",
-    "IdswyftAPIError", 
+    "IdswyftAPIError",
     "IdswyftAuthenticationError",
     "IdswyftValidationError",
     "IdswyftNetworkError",
     "IdswyftRateLimitError",
+    "IdswyftTimeoutError",
     "VerificationResult",
     "DocumentVerificationRequest",
     "SelfieVerificationRequest",
@@ -52,4 +96,4 @@ __all__ = [
     "QualityAnalysis",
     "QualityAnalysisResolution",
     "QualityAnalysisFileSize",
-]
\ No newline at end of file
+]
@@ -0,0 +1,836 @@
+"""
+Async client class for the Idswyft SDK
+"""
+
+import asyncio
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, AsyncIterator, List, Optional, BinaryIO, Union, cast
+
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+from .client import (
+    IdswyftClient,
+    _ClientBase,
+    _MAX_PAGE_SIZE,
+    _TERMINAL_STATUSES,
+    _dumps,
+    _has_next_page,
+)
+from .types import (
+    VerificationResult,
+    StartVerificationResponse,
+    LiveTokenResponse,
+    UsageStats,
+    ListVerificationsResponse,
+    FileData,
+)
+from .exceptions import (
+    IdswyftNetworkError,
+    IdswyftNotFoundError,
+    IdswyftRateLimitError,
+    IdswyftTimeoutError,
+)
+
+
+class IdswyftAsyncClient(_ClientBase):
+    """
+    Async client for the Idswyft identity verification API
+
+    Mirrors IdswyftClient, but every API method is a coroutine. Requests are
+    multiplexed over a pooled httpx connection (HTTP/2 by default), so many
+    verifications can be in flight at once from a single event loop.
+
+    Requires the optional ``async`` extra: ``pip install "idswyft[async]"``
+
+    Args:
+        api_key: Your Idswyft API key
+        base_url: API base URL (default: https://api.idswyft.com)
+        timeout: Request timeout in seconds (default: 30)
+        sandbox: Whether to use sandbox environment (default: False)
+        http2: Whether to negotiate HTTP/2 (default: True)
+        pool_size: Maximum number of pooled connections (default: 20). With
+            HTTP/2 each connection carries many concurrent requests.
+        cache_ttl: Seconds to reuse parsed GET responses for the same URL and
+            query before asking the API again, after which they are
+            revalidated with their ETag; 0 disables caching (default: 0)
+
+    Example:
+        >>> import asyncio
+        >>> import idswyft
+        >>> async def main():
+        ...     async with idswyft.IdswyftAsyncClient(api_key="your-api-key") as client:
+        ...         results = await asyncio.gather(
+        ...             client.verify_document("passport", document_file="a.jpg"),
+        ...             client.verify_document("passport", document_file="b.jpg"),
+        ...         )
+        >>> asyncio.run(main())
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.idswyft.com",
+        timeout: int = 30,
+        sandbox: bool = False,
+        http2: bool = True,
+        pool_size: int = 20,
+        cache_ttl: float = 0,
+    ):
+        if not api_key:
+            raise ValueError("API key is required")
+        if httpx is None:
+            raise ImportError(
+                'IdswyftAsyncClient requires httpx: pip install "idswyft[async]"'
+            )
+
+        self.api_key = api_key
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.sandbox = sandbox
+        self.cache_ttl = cache_ttl
+
+        # GET responses reused for cache_ttl seconds, and the last ETag seen
+        # per cached GET so an expired entry can be revalidated with a 304
+        self._response_cache_lock = threading.Lock()
+        self._response_cache = OrderedDict()  # (url, params) -> (expires_at, body)
+        self._etags = OrderedDict()  # (url, params) -> (etag, raw body)
+
+        self.session = httpx.AsyncClient(
+            http2=http2,
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=pool_size, max_keepalive_connections=pool_size
+            ),
+            headers=self._default_headers(),
+        )
+
+    async def _make_request(
+        self,
+        method: str,
+        endpoint: str,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Dict[str, Any]:
+        """Make an HTTP request to the API"""
+        # Endpoints all start with "/" and base_url has its trailing slash
+        # stripped, so plain concatenation is enough (and, unlike urljoin,
+        # keeps any path prefix in base_url)
+        url = self.base_url + endpoint
+
+        cache_key = self._cache_key(method, url, params)
+        cached, known = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        # Past its TTL, a cached GET is revalidated with the ETag it came with
+        headers = self._conditional_headers(known)
+        try:
+            response = await self.session.request(
+                method=method,
+                url=url,
+                data=data,
+                files=files,
+                params=params,
+                headers=headers,
+            )
+        except httpx.TimeoutException:
+            raise IdswyftNetworkError(f"Request timed out after {self.timeout} seconds")
+        except httpx.ConnectError:
+            raise IdswyftNetworkError("Failed to connect to Idswyft API")
+        except httpx.HTTPError as e:
+            raise IdswyftNetworkError(f"Network error: {str(e)}")
+
+        return self._finish_response(cache_key, known, response)
+
+    async def start_verification(
+        self,
+        user_id: str,
+        sandbox: Optional[bool] = None,
+    ) -> StartVerificationResponse:
+        """
+        Start a new verification session
+
+        Args:
+            user_id: Unique identifier for the user
+            sandbox: Whether to use sandbox environment
+
+        Returns:
+            StartVerificationResponse dictionary containing verification_id and
+            next steps
+        """
+        data: Dict[str, Any] = {"user_id": user_id}
+        if sandbox is not None:
+            data["sandbox"] = sandbox
+
+        response = await self._make_request("POST", "/api/verify/start", data=data)
+        return cast(StartVerificationResponse, response)
+
+    async def verify_document(
+        self,
+        document_type: str,
+        document_file: FileData,
+        verification_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> VerificationResult:
+        """
+        Verify a government-issued document
+
+        Args:
+            document_type: Type of document ('passport', 'drivers_license',
+                'national_id', 'other')
+            document_file: Document file (path, bytes, or file-like object)
+            verification_id: Optional verification session ID (from start_verification)
+            user_id: Optional user identifier
+            webhook_url: Optional webhook URL for status updates
+            metadata: Optional custom metadata
+
+        Returns:
+            VerificationResult dictionary containing verification details
+        """
+        data = {"document_type": document_type}
+
+        if verification_id:
+            data["verification_id"] = verification_id
+        if user_id:
+            data["user_id"] = user_id
+        if webhook_url:
+            data["webhook_url"] = webhook_url
+        if metadata:
+            data["metadata"] = _dumps(metadata)
+
+        file_tuple = self._prepare_file(document_file, "document")
+        files = {"document": file_tuple}
+
+        try:
+            response = await self._make_request(
+                "POST", "/api/verify/document", data=data, files=files
+            )
+        finally:
+            # Close the handle _prepare_file opened for a path
+            if isinstance(document_file, str):
+                file_tuple[1].close()
+        return cast(VerificationResult, response.get("verification", response))
+
+    async def verify_documents_bulk(
+        self,
+        items: List[Dict[str, Any]],
+        max_workers: int = 8,
+    ) -> List[VerificationResult]:
+        """
+        Verify several documents concurrently
+
+        Args:
+            items: One dict of verify_document keyword arguments per document
+            max_workers: Maximum concurrent uploads (default: 8)
+
+        Returns:
+            List of VerificationResult dictionaries, in the same order as items.
+            If any upload fails, its exception is raised once all uploads
+            have finished.
+        """
+        semaphore = asyncio.Semaphore(max(1, max_workers))
+
+        async def verify(item: Dict[str, Any]) -> VerificationResult:
+            async with semaphore:
+                return await self.verify_document(**item)
+
+        results = await asyncio.gather(
+            *(verify(item) for item in items), return_exceptions=True
+        )
+        for result in results:
+            if isinstance(result, BaseException):
+                raise result
+        return cast(List[VerificationResult], results)
+
+    async def verify_back_of_id(
+        self,
+        verification_id: str,
+        document_type: str,
+        back_of_id_file: FileData,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> VerificationResult:
+        """
+        Upload back-of-ID for enhanced verification with barcode scanning
+
+        Args:
+            verification_id: Existing verification session ID
+            document_type: Type of document
+            back_of_id_file: Back of ID file (path, bytes, or file-like object)
+            metadata: Optional custom metadata
+
+        Returns:
+            VerificationResult dictionary with enhanced verification details
+        """
+        data = {
+            "verification_id": verification_id,
+            "document_type": document_type,
+        }
+
+        if metadata:
+            data["metadata"] = _dumps(metadata)
+
+        file_tuple = self._prepare_file(back_of_id_file, "back_of_id")
+        files = {"back_of_id": file_tuple}
+
+        try:
+            response = await self._make_request(
+                "POST", "/api/verify/back-of-id", data=data, files=files
+            )
+            return cast(VerificationResult, response)
+        finally:
+            if isinstance(back_of_id_file, str):
+                file_tuple[1].close()
+
+    async def live_capture(
+        self,
+        verification_id: str,
+        live_image_data: Union[str, bytes, BinaryIO],
+        challenge_response: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> VerificationResult:
+        """
+        Perform live capture with AI liveness detection
+
+        Args:
+            verification_id: Existing verification session ID
+            live_image_data: Base64 encoded live image data, or the raw image
+                as bytes or a file-like object. Raw images are uploaded as a
+                file, which skips base64 encoding and is a third smaller.
+            challenge_response: Optional challenge response (blink, smile, etc.)
+            metadata: Optional custom metadata
+
+        Returns:
+            VerificationResult dictionary with liveness detection results
+        """
+        data = {"verification_id": verification_id}
+        files = None
+
+        if isinstance(live_image_data, str):
+            data["live_image_data"] = live_image_data
+        else:
+            files = {"live_image": self._prepare_file(live_image_data, "live_image")}
+
+        if challenge_response:
+            data["challenge_response"] = challenge_response
+        if metadata:
+            data["metadata"] = _dumps(metadata)
+
+        response = await self._make_request(
+            "POST", "/api/verify/live-capture", data=data, files=files
+        )
+        return cast(VerificationResult, response)
+
+    async def generate_live_token(
+        self,
+        verification_id: str,
+        challenge_type: Optional[str] = None,
+    ) -> LiveTokenResponse:
+        """
+        Generate a secure token for live capture sessions
+
+        Args:
+            verification_id: Existing verification session ID
+            challenge_type: Optional challenge type ('blink', 'smile',
+                'turn_head', 'random')
+
+        Returns:
+            LiveTokenResponse dictionary with token and challenge details
+        """
+        data = {"verification_id": verification_id}
+
+        if challenge_type:
+            data["challenge_type"] = challenge_type
+
+        response = await self._make_request(
+            "POST", "/api/verify/generate-live-token", data=data
+        )
+        return cast(LiveTokenResponse, response)
+
+    async def get_verification_results(
+        self, verification_id: str
+    ) -> VerificationResult:
+        """
+        Get complete verification results including all enhancements
+
+        Args:
+            verification_id: ID of the verification session
+
+        Returns:
+            VerificationResult dictionary with comprehensive verification data
+        """
+        response = await self._make_request(
+            "GET", f"/api/verify/results/{verification_id}"
+        )
+        return cast(VerificationResult, response)
+
+    async def get_verification_history(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get verification history for a user
+
+        Args:
+            user_id: User identifier
+            limit: Optional limit (default: 100, max: 1000)
+            offset: Optional offset for pagination
+
+        Returns:
+            Dictionary containing list of verifications and pagination info
+        """
+        params = {}
+        if limit:
+            params["limit"] = str(limit)
+        if offset:
+            params["offset"] = str(offset)
+
+        return await self._make_request(
+            "GET", f"/api/verify/history/{user_id}", params=params
+        )
+
+    async def verify_selfie(
+        self,
+        selfie_file: FileData,
+        verification_id: Optional[str] = None,
+        reference_document_id: Optional[str] = None,
+        user_id: Optional[str] = None,
+        webhook_url: Optional[str] = None,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> VerificationResult:
+        """
+        Verify a selfie, optionally against a reference document
+
+        Args:
+            selfie_file: Selfie file (path, bytes, or file-like object)
+            verification_id: Optional verification session ID (from start_verification)
+            reference_document_id: Optional document ID to match against
+            user_id: Optional user identifier
+            webhook_url: Optional webhook URL for status updates
+            metadata: Optional custom metadata
+
+        Returns:
+            VerificationResult dictionary containing verification details
+        """
+        data = {}
+
+        if verification_id:
+            data["verification_id"] = verification_id
+        if reference_document_id:
+            data["reference_document_id"] = reference_document_id
+        if user_id:
+            data["user_id"] = user_id
+        if webhook_url:
+            data["webhook_url"] = webhook_url
+        if metadata:
+            data["metadata"] = _dumps(metadata)
+
+        file_tuple = self._prepare_file(selfie_file, "selfie")
+        files = {"selfie": file_tuple}
+
+        try:
+            response = await self._make_request(
+                "POST", "/api/verify/selfie", data=data, files=files
+            )
+        finally:
+            if isinstance(selfie_file, str):
+                file_tuple[1].close()
+        return cast(VerificationResult, response.get("verification", response))
+
+    async def get_verification_status(self, verification_id: str) -> VerificationResult:
+        """
+        Get the current status of a verification request
+
+        Args:
+            verification_id: ID of the verification request
+
+        Returns:
+            VerificationResult dictionary with current status
+        """
+        response = await self._make_request(
+            "GET", f"/api/verify/status/{verification_id}"
+        )
+        return cast(VerificationResult, response["verification"])
+
+    async def wait_for_completion(
+        self,
+        verification_id: str,
+        timeout: float = 300,
+        initial: float = 0.5,
+        factor: float = 1.7,
+        max_interval: float = 15,
+    ) -> VerificationResult:
+        """
+        Wait until a verification reaches a final status or manual review
+
+        Same backoff as IdswyftClient.wait_for_completion, but sleeps with
+        asyncio.sleep so other tasks keep running in between checks.
+
+        Args:
+            verification_id: ID of the verification request
+            timeout: Maximum number of seconds to wait
+            initial: Seconds of backoff after the first check; each wait is
+                a random 50-100% of the current backoff
+            factor: Multiplier applied to the wait after each check
+            max_interval: Upper bound on the wait between checks
+
+        Returns:
+            VerificationResult in a final status ('verified', 'failed'), or
+            'manual_review' if the verification is waiting on a reviewer
+
+        Raises:
+            IdswyftTimeoutError: If the verification is still in progress
+                after timeout seconds
+        """
+        deadline = time.monotonic() + timeout
+        interval = initial
+
+        while True:
+            # Each wait is a random 50-100% of the backoff interval, so
+            # clients that started together don't keep polling in step
+            delay = interval * random.uniform(0.5, 1.0)
+            try:
+                verification = await self.get_verification_status(verification_id)
+                if verification.get("status") in _TERMINAL_STATUSES:
+                    return verification
+                interval = min(interval * factor, max_interval)
+            except IdswyftRateLimitError as e:
+                delay = max(delay, e.retry_after or 0)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise IdswyftTimeoutError(
+                    f"Verification {verification_id} did not complete "
+                    f"within {timeout} seconds",
+                    verification_id=verification_id,
+                )
+            await asyncio.sleep(min(delay, remaining))
+
+    async def list_verifications(
+        self,
+        status: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        user_id: Optional[str] = None,
+    ) -> ListVerificationsResponse:
+        """
+        List verification requests
+
+        Args:
+            status: Optional status filter
+            limit: Optional limit (default: 100, max: 1000)
+            offset: Optional offset for pagination
+            user_id: Optional user ID filter
+
+        Returns:
+            Dictionary containing list of verifications and pagination info
+        """
+        # Unset filters are left out; the HTTP library stringifies ints
+        params = {
+            name: value
+            for name, value in (
+                ("status", status),
+                ("limit", limit),
+                ("offset", offset),
+                ("user_id", user_id),
+            )
+            if value
+        }
+
+        response = await self._make_request("GET", "/api/verify/list", params=params)
+        return cast(ListVerificationsResponse, response)
+
+    async def iter_verifications(
+        self,
+        page_size: int = 100,
+        status: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> AsyncIterator[VerificationResult]:
+        """
+        Iterate over all verifications, one page request at a time
+
+        The next page is requested as a task while the current one is being
+        consumed, so a full scan doesn't wait a round trip per page.
+
+        Args:
+            page_size: Verifications per request (max: 1000)
+            status: Optional status filter
+            user_id: Optional user ID filter
+
+        Yields:
+            VerificationResult dictionaries
+        """
+        # Larger pages would come back short and look like the last one
+        page_size = min(page_size, _MAX_PAGE_SIZE)
+        offset = 0
+        page = await self.list_verifications(
+            status=status, limit=page_size, offset=offset, user_id=user_id
+        )
+
+        while True:
+            verifications = page.get("verifications", [])
+            offset += len(verifications)
+
+            next_page = None
+            if _has_next_page(page, page_size, offset):
+                next_page = asyncio.ensure_future(
+                    self.list_verifications(
+                        status=status, limit=page_size, offset=offset, user_id=user_id
+                    )
+                )
+
+            try:
+                for verification in verifications:
+                    yield verification
+            except BaseException:
+                # Iteration stopped early; don't leave the prefetch running
+                if next_page is not None:
+                    next_page.cancel()
+                raise
+
+            if next_page is None:
+                return
+            page = await next_page
+
+    async def register_developer(self, email: str, name: str) -> Dict[str, str]:
+        """
+        Register as a new developer
+
+        Args:
+            email: Developer email address
+            name: Developer name
+
+        Returns:
+            Dictionary with developer_id and message
+        """
+        data = {"email": email, "name": name}
+        return await self._make_request("POST", "/api/developer/register", data=data)
+
+    async def create_api_key(self, name: str, environment: str) -> Dict[str, str]:
+        """
+        Create a new API key
+
+        Args:
+            name: API key name/description
+            environment: Environment ('sandbox' or 'production')
+
+        Returns:
+            Dictionary with api_key and key_id
+        """
+        data = {"name": name, "environment": environment}
+        return await self._make_request("POST", "/api/developer/api-key", data=data)
+
+    async def list_api_keys(self) -> Dict[str, list]:
+        """
+        List all API keys
+
+        Returns:
+            Dictionary with api_keys list
+        """
+        return await self._make_request("GET", "/api/developer/api-keys")
+
+    async def revoke_api_key(self, key_id: str) -> Dict[str, Any]:
+        """
+        Revoke/delete an API key
+
+        Args:
+            key_id: API key ID to revoke
+
+        Returns:
+            Dictionary with success status and message
+        """
+        return await self._make_request("DELETE", f"/api/developer/api-key/{key_id}")
+
+    async def get_api_activity(
+        self,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get API activity logs
+
+        Args:
+            limit: Optional limit (default: 100, max: 1000)
+            offset: Optional offset for pagination
+            start_date: Optional start date filter (ISO format)
+            end_date: Optional end date filter (ISO format)
+
+        Returns:
+            Dictionary containing activities and pagination info
+        """
+        params = {}
+        if limit:
+            params["limit"] = str(limit)
+        if offset:
+            params["offset"] = str(offset)
+        if start_date:
+            params["start_date"] = start_date
+        if end_date:
+            params["end_date"] = end_date
+
+        return await self._make_request("GET", "/api/developer/activity", params=params)
+
+    async def register_webhook(
+        self,
+        url: str,
+        events: Optional[list] = None,
+        secret: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Register a webhook URL
+
+        Args:
+            url: Webhook URL
+            events: Optional list of events to subscribe to
+            secret: Optional webhook secret for signature verification
+
+        Returns:
+            Dictionary with webhook information
+        """
+        data: Dict[str, Any] = {"url": url}
+        if events:
+            data["events"] = events
+        if secret:
+            data["secret"] = secret
+
+        return await self._make_request("POST", "/api/webhooks/register", data=data)
+
+    async def list_webhooks(self) -> Dict[str, list]:
+        """
+        List all webhooks
+
+        Returns:
+            Dictionary with webhooks list
+        """
+        return await self._make_request("GET", "/api/webhooks")
+
+    async def update_webhook(
+        self,
+        webhook_id: str,
+        url: Optional[str] = None,
+        events: Optional[list] = None,
+        secret: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """
+        Update a webhook
+
+        Args:
+            webhook_id: Webhook ID to update
+            url: Optional new webhook URL
+            events: Optional new events list
+            secret: Optional new webhook secret
+
+        Returns:
+            Dictionary with updated webhook information
+        """
+        data: Dict[str, Any] = {}
+        if url:
+            data["url"] = url
+        if events is not None:
+            data["events"] = events
+        if secret is not None:
+            data["secret"] = secret
+
+        return await self._make_request("PUT", f"/api/webhooks/{webhook_id}", data=data)
+
+    async def delete_webhook(self, webhook_id: str) -> Dict[str, Any]:
+        """
+        Delete a webhook
+
+        Args:
+            webhook_id: Webhook ID to delete
+
+        Returns:
+            Dictionary with success status and message
+        """
+        return await self._make_request("DELETE", f"/api/webhooks/{webhook_id}")
+
+    async def test_webhook(self, webhook_id: str) -> Dict[str, Any]:
+        """
+        Test webhook delivery
+
+        Args:
+            webhook_id: Webhook ID to test
+
+        Returns:
+            Dictionary with success status and delivery_id
+        """
+        return await self._make_request("POST", f"/api/webhooks/{webhook_id}/test")
+
+    async def get_webhook_deliveries(
+        self,
+        webhook_id: str,
+        limit: Optional[int] = None,
+        offset: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        Get webhook delivery history
+
+        Args:
+            webhook_id: Webhook ID
+            limit: Optional limit (default: 100, max: 1000)
+            offset: Optional offset for pagination
+
+        Returns:
+            Dictionary containing deliveries and pagination info
+        """
+        params = {}
+        if limit:
+            params["limit"] = str(limit)
+        if offset:
+            params["offset"] = str(offset)
+
+        return await self._make_request(
+            "GET", f"/api/webhooks/{webhook_id}/deliveries", params=params
+        )
+
+    async def get_usage_stats(self) -> UsageStats:
+        """
+        Get developer usage statistics
+
+        Returns:
+            UsageStats dictionary with usage information
+        """
+        response = await self._make_request("GET", "/api/developer/stats")
+        return cast(UsageStats, response)
+
+    async def health_check(self) -> Dict[str, str]:
+        """
+        Check API health status
+
+        Returns:
+            Dictionary with status and timestamp
+        """
+        try:
+            return await self._make_request("GET", "/api/health")
+        except IdswyftNotFoundError:
+            # Fallback for basic connectivity test
+            return {"status": "ok", "timestamp": ""}
+
+    # Webhook signatures are verified locally, so the sync helper applies as-is
+    verify_webhook_signature = staticmethod(IdswyftClient.verify_webhook_signature)
+    webhook_verifier = staticmethod(IdswyftClient.webhook_verifier)
+
+    async def __aenter__(self) -> "IdswyftAsyncClient":
+        """Async context manager entry"""
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        """Async context manager exit"""
+        await self.session.aclose()
+
+    async def close(self) -> None:
+        """Close the HTTP connection pool"""
+        await self.session.aclose()
@@ -5,10 +5,36 @@ Main client class for the Idswyft SDK
 import json
 import hashlib
 import hmac
+import mimetypes
+import os
+import random
+import socket
+import sys
+import threading
+import time
 import requests
-from typing import Dict, Any, Optional, BinaryIO, Union
-from urllib.parse import urljoin, urlencode
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import (
+    Dict,
+    Any,
+    Callable,
+    Iterator,
+    List,
+    Mapping,
+    NoReturn,
+    Optional,
+    BinaryIO,
+    Tuple,
+    Union,
+    cast,
+)
+from urllib.parse import urlencode
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
 
+from . import USER_AGENT, __version__
 from .types import (
     VerificationResult,
     DocumentVerificationRequest,
@@ -36,19 +62,409 @@ from .exceptions import (
     IdswyftRateLimitError,
     IdswyftNotFoundError,
     IdswyftServerError,
+    IdswyftTimeoutError,
 )
 
+try:
+    import httpx
+except ImportError:
+    httpx = None  # type: ignore[assignment]
+
+try:
+    from requests_toolbelt import MultipartEncoder
+except ImportError:
+    MultipartEncoder = None
+
+# orjson.loads and json.loads differ in signature but both take bytes or str
+_loads: Callable[[Union[bytes, str]], Any]
+try:
+    import orjson
+
+    # orjson decodes straight from the response bytes and is several times
+    # faster than the stdlib on large list pages
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> str:
+        # Form fields are text; OPT_NON_STR_KEYS keeps json.dumps' handling
+        # of int keys in metadata
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+
+except ImportError:
+    _loads = json.loads
+    _dumps = json.dumps
+
+# Sent with every request; only the API key differs between clients
+_DEFAULT_HEADERS = {
+    "User-Agent": USER_AGENT,
+    "X-SDK-Version": __version__,
+    "X-SDK-Language": "python",
+}
+
+# Automated processing is over once a verification reaches one of these
+# statuses, so polling can stop
+_TERMINAL_STATUSES = frozenset(("verified", "failed", "manual_review"))
+# A verification never changes again once it reaches one of these; a
+# manual_review is still moved to verified or failed by a reviewer
+_FINAL_STATUSES = frozenset(("verified", "failed"))
+_STATUS_CACHE_SIZE = 1024
+
+# Enum-like fields whose values repeat across every verification record
+_INTERNED_FIELDS = ("status", "type", "document_type")
+_RESPONSE_CACHE_SIZE = 256
+
+# Non-JSON error bodies (e.g. gateway HTML pages) are cut to this many characters
+_MAX_ERROR_TEXT = 2048
+
+# The API rejects uploaded files larger than this
+_MAX_UPLOAD_SIZE = 10 * 1024 * 1024
+
+# Most verifications the API returns per list request
+_MAX_PAGE_SIZE = 1000
+
+
+# Leading bytes of the file types the API accepts for uploads
+_FILE_SIGNATURES = (
+    (b"\xff\xd8\xff", "image/jpeg"),
+    (b"\x89PNG\r\n\x1a\n", "image/png"),
+    (b"%PDF", "application/pdf"),
+)
+
+
+def _sniff_content_type(head: bytes) -> str:
+    """Guess an upload's content type from its first bytes"""
+    for signature, content_type in _FILE_SIGNATURES:
+        if head.startswith(signature):
+            return content_type
+    if head[:4] == b"RIFF" and head[8:12] == b"WEBP":
+        return "image/webp"
+    return "application/octet-stream"
+
+
+def _check_upload_size(size: int, field_name: str) -> None:
+    """Fail before sending a file the API would refuse for its size"""
+    if size > _MAX_UPLOAD_SIZE:
+        raise IdswyftValidationError(
+            f"File is {size / (1024 * 1024):.1f} MB; uploads are limited to "
+            f"{_MAX_UPLOAD_SIZE // (1024 * 1024)} MB",
+            field=field_name,
+        )
+
+
+# urllib3 already disables Nagle (TCP_NODELAY); add keep-alive probes so
+# idle pooled connections dropped by a NAT or load balancer are noticed
+_SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+    (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+]
+
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose pooled connections use _SOCKET_OPTIONS"""
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs.setdefault("socket_options", _SOCKET_OPTIONS)
+        super().init_poolmanager(*args, **kwargs)
+
+
+def _intern_fields(body: Any) -> Any:
+    """Share one copy of the repeated enum strings across parsed responses"""
+    if not isinstance(body, dict):
+        return body
+    records = body.get("verifications")
+    if not isinstance(records, list):
+        records = []
+    for record in (body, body.get("verification"), *records):
+        if isinstance(record, dict):
+            for field in _INTERNED_FIELDS:
+                value = record.get(field)
+                if type(value) is str:
+                    record[field] = sys.intern(value)
+    return body
+
+
+def _has_next_page(page: Mapping[str, Any], page_size: int, offset: int) -> bool:
+    """Whether a list page is followed by another, given the running offset"""
+    verifications = page.get("verifications", [])
+    if not verifications:
+        return False
+    total: Optional[int] = page.get("total")
+    if total is not None:
+        return offset < total
+    # Without a total, a short page is taken to be the last one
+    return len(verifications) >= page_size
+
+
+class WebhookVerifier:
+    """
+    Verifies webhook signatures against a fixed secret
+
+    The HMAC key schedule is computed once and copied for each payload,
+    which is cheaper than building a new HMAC per webhook.
+    """
+
+    def __init__(self, secret: Union[str, bytes]):
+        if isinstance(secret, str):
+            secret = secret.encode("utf-8")
+        self._base = hmac.new(secret, digestmod=hashlib.sha256)
+
+    def verify(self, payload: Union[str, bytes], signature: Union[str, bytes]) -> bool:
+        """Return True if signature is the HMAC-SHA256 of payload"""
+        if not payload or not signature:
+            return False
+
+        try:
+            if isinstance(payload, str):
+                payload = payload.encode("utf-8")
+            if isinstance(signature, (bytes, bytearray)):
+                # Raw ASGI/WSGI headers arrive as bytes
+                signature = signature.decode("ascii")
+
+            # Remove 'sha256=' prefix if present
+            if signature.startswith("sha256="):
+                signature = signature[len("sha256=") :]
+
+            mac = self._base.copy()
+            mac.update(payload)
+
+            # Use hmac.compare_digest for timing-safe comparison of raw digests
+            return hmac.compare_digest(mac.digest(), bytes.fromhex(signature))
+        except Exception:
+            return False
+
 
-class IdswyftClient:
+class _ClientBase:
+    """
+    Request helpers shared by IdswyftClient and IdswyftAsyncClient
+
+    Nothing here depends on the HTTP library: headers, error mapping,
+    response caching and upload preparation work the same for both.
+    """
+
+    api_key: str
+    cache_ttl: float
+    _response_cache_lock: threading.Lock
+    # (url, params) -> (expires_at, body)
+    _response_cache: "OrderedDict[tuple, Tuple[float, Dict[str, Any]]]"
+    _etags: "OrderedDict[tuple, Tuple[str, bytes]]"  # (url, params) -> (etag, raw body)
+
+    def _default_headers(self) -> Dict[str, str]:
+        """Headers sent with every request"""
+        return {**_DEFAULT_HEADERS, "X-API-Key": self.api_key}
+
+    def _error_data(self, response: Any) -> Dict[str, Any]:
+        """Error details from a failed response, parsing the body only if it is JSON"""
+        # Load balancers answer 502/504 with HTML pages that aren't worth parsing
+        if "json" in response.headers.get("Content-Type", ""):
+            try:
+                data: Dict[str, Any] = response.json()
+                return data
+            except json.JSONDecodeError:
+                pass
+        return {"error": "Unknown error", "message": response.text[:_MAX_ERROR_TEXT]}
+
+    def _cache_key(
+        self,
+        method: str,
+        url: str,
+        params: Optional[Dict[str, Any]],
+    ) -> Optional[tuple]:
+        """Key for the response cache, or None if the request isn't cacheable"""
+        if method != "GET" or self.cache_ttl <= 0:
+            return None
+        return (url, tuple(sorted((params or {}).items())))
+
+    def _get_cached(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a cached response body that hasn't expired yet"""
+        with self._response_cache_lock:
+            entry = self._response_cache.get(key)
+            if entry is None:
+                return None
+            expires_at, body = entry
+            if expires_at < time.monotonic():
+                del self._response_cache[key]
+                return None
+            self._response_cache.move_to_end(key)
+            return body
+
+    def _store_cached(self, key: tuple, response: Any, body: Dict[str, Any]) -> None:
+        """Cache a parsed response body unless the API asked us not to"""
+        if "no-store" in response.headers.get("Cache-Control", ""):
+            return
+
+        ttl = self.cache_ttl
+        verification = (
+            body.get("verification", body) if isinstance(body, dict) else None
+        )
+        if (
+            isinstance(verification, dict)
+            and verification.get("status") in _FINAL_STATUSES
+        ):
+            # A decided verification won't change, so keep it until evicted
+            ttl = float("inf")
+
+        with self._response_cache_lock:
+            self._response_cache[key] = (time.monotonic() + ttl, body)
+            self._response_cache.move_to_end(key)
+            if len(self._response_cache) > _RESPONSE_CACHE_SIZE:
+                self._response_cache.popitem(last=False)
+
+    def _get_etag(self, key: tuple) -> Optional[Tuple[str, bytes]]:
+        """Return the (etag, raw body) pair last seen for a GET, if any"""
+        with self._response_cache_lock:
+            return self._etags.get(key)
+
+    def _store_etag(self, key: tuple, response: Any) -> None:
+        """Remember a response's ETag with its raw body for revalidation"""
+        etag = response.headers.get("ETag")
+        if not etag:
+            return
+
+        with self._response_cache_lock:
+            self._etags[key] = (etag, response.content)
+            self._etags.move_to_end(key)
+            if len(self._etags) > _RESPONSE_CACHE_SIZE:
+                self._etags.popitem(last=False)
+
+    def _cache_lookup(
+        self, key: Optional[tuple]
+    ) -> Tuple[Optional[Dict[str, Any]], Optional[Tuple[str, bytes]]]:
+        """
+        Look up a GET before sending it
+
+        Returns the cached body if it hasn't expired, and otherwise the
+        (etag, raw body) pair to revalidate it with, if one was kept.
+        """
+        if key is None:
+            return None, None
+        cached = self._get_cached(key)
+        if cached is not None:
+            return cached, None
+        return None, self._get_etag(key)
+
+    @staticmethod
+    def _conditional_headers(
+        known: Optional[Tuple[str, bytes]],
+    ) -> Optional[Dict[str, str]]:
+        """If-None-Match header for revalidating a cached GET with its ETag"""
+        return {"If-None-Match": known[0]} if known is not None else None
+
+    def _finish_response(
+        self,
+        key: Optional[tuple],
+        known: Optional[Tuple[str, bytes]],
+        response: Any,
+    ) -> Dict[str, Any]:
+        """Parse a response and cache it if it was a cacheable GET; raise on errors"""
+        # Unchanged since the last fetch, so reuse the body received then.
+        # It is parsed again so this caller doesn't share the earlier dict.
+        if response.status_code == 304 and key is not None and known is not None:
+            body: Dict[str, Any] = _intern_fields(_loads(known[1]))
+            self._store_cached(key, response, body)
+            return body
+
+        if response.status_code == 200 or response.status_code == 201:
+            try:
+                body = _intern_fields(_loads(response.content))
+            except json.JSONDecodeError:
+                return {"message": "Success"}
+            if key is not None:
+                self._store_etag(key, response)
+                self._store_cached(key, response, body)
+            return body
+
+        self._raise_for_status(response.status_code, self._error_data(response))
+
+    def _raise_for_status(
+        self, status_code: int, error_data: Dict[str, Any]
+    ) -> NoReturn:
+        """Raise appropriate exception based on status code"""
+        message = error_data.get("message", "API request failed")
+        error_code = error_data.get("code")
+        details = error_data.get("details")
+
+        if status_code == 400:
+            raise IdswyftValidationError(
+                message,
+                field=error_data.get("field"),
+                validation_errors=details if isinstance(details, list) else None,
+            )
+        elif status_code == 401:
+            raise IdswyftAuthenticationError(message)
+        elif status_code == 404:
+            resource = error_data.get("resource", "Resource")
+            raise IdswyftNotFoundError(resource)
+        elif status_code == 429:
+            retry_after = error_data.get("retry_after")
+            raise IdswyftRateLimitError(message, retry_after)
+        elif 500 <= status_code < 600:
+            raise IdswyftServerError(message)
+        else:
+            raise IdswyftAPIError(message, status_code, error_code, details)
+
+    def _prepare_file(self, file_data: FileData, field_name: str = "file") -> tuple:
+        """
+        Prepare file data for upload
+
+        Paths and file-like objects are passed on as open handles rather than
+        read into memory first, so the HTTP library can send them from disk.
+        A handle opened here for a path must be closed by the caller.
+
+        Files over the API's upload limit raise IdswyftValidationError here
+        instead of being sent and rejected.
+        """
+        if isinstance(file_data, str):
+            # File path
+            _check_upload_size(os.path.getsize(file_data), field_name)
+            content_type = (
+                mimetypes.guess_type(file_data)[0] or "application/octet-stream"
+            )
+            return (field_name, open(file_data, "rb"), content_type)
+        elif isinstance(file_data, bytes):
+            # Raw bytes; there is no file name to go by, so look at the
+            # content, since the API rejects uploads typed octet-stream
+            _check_upload_size(len(file_data), field_name)
+            return (field_name, file_data, _sniff_content_type(file_data[:12]))
+        elif hasattr(file_data, "read"):
+            # File-like object
+            if getattr(file_data, "seekable", lambda: False)():
+                position = file_data.tell()
+                size = file_data.seek(0, os.SEEK_END) - position
+                file_data.seek(position)
+                _check_upload_size(size, field_name)
+            name = getattr(file_data, "name", None)
+            content_type = (
+                mimetypes.guess_type(name)[0] if isinstance(name, str) else None
+            ) or "application/octet-stream"
+            return (field_name, file_data, content_type)
+        else:
+            raise ValueError(f"Invalid file data type: {type(file_data)}")
+
+
+class IdswyftClient(_ClientBase):
     """
     Official Python client for the Idswyft identity verification API
-    
+
+    One client can be shared by many threads. Its session headers are fixed
+    at construction, authentication doesn't depend on cookies, and the
+    connection pool is sized by pool_size.
+
     Args:
         api_key: Your Idswyft API key
         base_url: API base URL (default: https://api.idswyft.com)
         timeout: Request timeout in seconds (default: 30)
         sandbox: Whether to use sandbox environment (default: False)
-        
+        pool_size: Number of keep-alive connections to hold open; raise it if
+            more threads share the client (default: 20)
+        max_retries: Retries for failed connections and 502/503/504 responses
+            to idempotent requests, with exponential backoff (default: 3)
+        transport: HTTP library to use, "requests" or "httpx" (default:
+            "requests"). "httpx" negotiates HTTP/2 so calls from several
+            threads are multiplexed over one connection; it requires
+            ``pip install "idswyft[async]"``. With "httpx", max_retries only
+            applies to failed connections.
+        cache_ttl: Seconds to reuse parsed GET responses for the same URL and
+            query before asking the API again, after which they are
+            revalidated with their ETag; 0 disables caching (default: 0)
+
     Example:
         >>> import idswyft
         >>> client = idswyft.IdswyftClient(api_key="your-api-key")
@@ -58,30 +474,86 @@ class IdswyftClient:
         ... )
         >>> print(result["status"])
     """
-    
+
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.idswyft.com",
         timeout: int = 30,
         sandbox: bool = False,
+        pool_size: int = 20,
+        max_retries: int = 3,
+        transport: str = "requests",
+        cache_ttl: float = 0,
     ):
         if not api_key:
             raise ValueError("API key is required")
-            
+        if transport not in ("requests", "httpx"):
+            raise ValueError(f"Unsupported transport: {transport}")
+        if transport == "httpx" and httpx is None:
+            raise ImportError(
+                'The httpx transport requires httpx: pip install "idswyft[async]"'
+            )
+
         self.api_key = api_key
         self.base_url = base_url.rstrip("/")
         self.timeout = timeout
         self.sandbox = sandbox
-        
+        self.transport = transport
+        self.cache_ttl = cache_ttl
+        self.pool_size = pool_size
+
+        # Shared state for get_verification_status(cache=True)
+        self._status_lock = threading.Lock()
+        # verification_id -> final result
+        self._status_cache: "OrderedDict[str, VerificationResult]" = OrderedDict()
+        self._status_inflight: "Dict[str, Future[VerificationResult]]" = {}
+
+        # GET responses reused for cache_ttl seconds, and the last ETag seen
+        # per cached GET so an expired entry can be revalidated with a 304
+        self._response_cache_lock = threading.Lock()
+        self._response_cache = OrderedDict()  # (url, params) -> (expires_at, body)
+        self._etags = OrderedDict()  # (url, params) -> (etag, raw body)
+
+        # _send is the only place that issues requests, and it checks
+        # self.transport to know which of the two this is
+        self.session: Union[requests.Session, "httpx.Client"]
+        if transport == "httpx":
+            self.session = httpx.Client(
+                headers=self._default_headers(),
+                timeout=timeout,
+                transport=httpx.HTTPTransport(
+                    http2=True,
+                    retries=max_retries,
+                    limits=httpx.Limits(
+                        max_connections=pool_size,
+                        max_keepalive_connections=pool_size,
+                    ),
+                ),
+            )
+            return
+
         # Initialize session with default headers
-        self.session = requests.Session()
-        self.session.headers.update({
-            "X-API-Key": api_key,
-            "User-Agent": "idswyft-python/2.0.0",
-            "X-SDK-Version": "2.0.0",
-            "X-SDK-Language": "python",
-        })
+        session = requests.Session()
+        session.headers.update(self._default_headers())
+
+        # requests keeps only 10 pooled connections by default and drops the
+        # rest, so threaded callers would keep re-doing TLS handshakes.
+        # POSTs are left out of the method retries (urllib3's default) since
+        # repeating an upload could create a duplicate verification.
+        adapter = _KeepAliveAdapter(
+            pool_connections=pool_size,
+            pool_maxsize=pool_size,
+            max_retries=Retry(
+                total=max_retries,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                raise_on_status=False,
+            ),
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        self.session = session
 
     def _make_request(
         self,
@@ -92,33 +564,75 @@ class IdswyftClient:
         params: Optional[Dict[str, Any]] = None,
     ) -> Dict[str, Any]:
         """Make an HTTP request to the API"""
-        url = urljoin(self.base_url, endpoint.lstrip("/"))
-        
+        # Endpoints all start with "/" and base_url has its trailing slash
+        # stripped, so plain concatenation is enough (and, unlike urljoin,
+        # keeps any path prefix in base_url)
+        url = self.base_url + endpoint
+
+        cache_key = self._cache_key(method, url, params)
+        cached, known = self._cache_lookup(cache_key)
+        if cached is not None:
+            return cached
+
+        # Past its TTL, a cached GET is revalidated with the ETag it came with
+        headers = self._conditional_headers(known)
+        response = self._send(
+            method, url, data=data, files=files, params=params, headers=headers
+        )
+        return self._finish_response(cache_key, known, response)
+
+    def _send(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        files: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+    ) -> Any:
+        """Send a request over the configured transport, raising IdswyftNetworkError"""
+        if self.transport == "httpx":
+            try:
+                return self.session.request(
+                    method=method,
+                    url=url,
+                    data=data,
+                    files=files,
+                    params=params,
+                    headers=headers,
+                    timeout=self.timeout,
+                )
+            except httpx.TimeoutException:
+                raise IdswyftNetworkError(
+                    f"Request timed out after {self.timeout} seconds"
+                )
+            except httpx.ConnectError:
+                raise IdswyftNetworkError("Failed to connect to Idswyft API")
+            except httpx.HTTPError as e:
+                raise IdswyftNetworkError(f"Network error: {str(e)}")
+
+        if files and MultipartEncoder is not None:
+            # requests assembles the whole multipart body in memory before
+            # sending; the encoder reads from the file handles as it streams
+            fields = [
+                (name, value if isinstance(value, (str, bytes)) else str(value))
+                for name, value in (data or {}).items()
+            ]
+            fields.extend(files.items())
+            encoder = MultipartEncoder(fields=fields)
+            headers = {**(headers or {}), "Content-Type": encoder.content_type}
+            data, files = encoder, None
+
         try:
-            response = self.session.request(
+            return self.session.request(
                 method=method,
                 url=url,
                 data=data,
                 files=files,
                 params=params,
+                headers=headers,
                 timeout=self.timeout,
             )
-            
-            # Handle different response status codes
-            if response.status_code == 200 or response.status_code == 201:
-                try:
-                    return response.json()
-                except json.JSONDecodeError:
-                    return {"message": "Success"}
-                    
-            # Handle error responses
-            try:
-                error_data = response.json()
-            except json.JSONDecodeError:
-                error_data = {"error": "Unknown error", "message": response.text}
-            
-            self._raise_for_status(response.status_code, error_data)
-            
         except requests.exceptions.Timeout:
             raise IdswyftNetworkError(f"Request timed out after {self.timeout} seconds")
         except requests.exceptions.ConnectionError:
@@ -126,46 +640,6 @@ class IdswyftClient:
         except requests.exceptions.RequestException as e:
             raise IdswyftNetworkError(f"Network error: {str(e)}")
 
-    def _raise_for_status(self, status_code: int, error_data: Dict[str, Any]) -> None:
-        """Raise appropriate exception based on status code"""
-        message = error_data.get("message", "API request failed")
-        error_code = error_data.get("code")
-        details = error_data.get("details")
-        
-        if status_code == 400:
-            raise IdswyftValidationError(
-                message, 
-                field=error_data.get("field"),
-                validation_errors=details if isinstance(details, list) else None
-            )
-        elif status_code == 401:
-            raise IdswyftAuthenticationError(message)
-        elif status_code == 404:
-            resource = error_data.get("resource", "Resource")
-            raise IdswyftNotFoundError(resource)
-        elif status_code == 429:
-            retry_after = error_data.get("retry_after")
-            raise IdswyftRateLimitError(message, retry_after)
-        elif 500 <= status_code < 600:
-            raise IdswyftServerError(message)
-        else:
-            raise IdswyftAPIError(message, status_code, error_code, details)
-
-    def _prepare_file(self, file_data: FileData, field_name: str = "file") -> tuple:
-        """Prepare file data for upload"""
-        if isinstance(file_data, str):
-            # File path
-            with open(file_data, "rb") as f:
-                return (field_name, f.read(), "application/octet-stream")
-        elif isinstance(file_data, bytes):
-            # Raw bytes
-            return (field_name, file_data, "application/octet-stream")
-        elif hasattr(file_data, "read"):
-            # File-like object
-            return (field_name, file_data.read(), "application/octet-stream")
-        else:
-            raise ValueError(f"Invalid file data type: {type(file_data)}")
-
     def start_verification(
         self,
         user_id: str,
@@ -173,20 +647,21 @@ class IdswyftClient:
     ) -> StartVerificationResponse:
         """
         Start a new verification session
-        
+
         Args:
             user_id: Unique identifier for the user
             sandbox: Whether to use sandbox environment
-            
+
         Returns:
-            StartVerificationResponse dictionary containing verification_id and next steps
+            StartVerificationResponse dictionary containing verification_id and
+            next steps
         """
-        data = {"user_id": user_id}
+        data: Dict[str, Any] = {"user_id": user_id}
         if sandbox is not None:
             data["sandbox"] = sandbox
-        
+
         response = self._make_request("POST", "/api/verify/start", data=data)
-        return response
+        return cast(StartVerificationResponse, response)
 
     def verify_document(
         self,
@@ -199,18 +674,19 @@ class IdswyftClient:
     ) -> VerificationResult:
         """
         Verify a government-issued document
-        
+
         Args:
-            document_type: Type of document ('passport', 'drivers_license', 'national_id', 'other')
+            document_type: Type of document ('passport', 'drivers_license',
+                'national_id', 'other')
             document_file: Document file (path, bytes, or file-like object)
             verification_id: Optional verification session ID (from start_verification)
             user_id: Optional user identifier
             webhook_url: Optional webhook URL for status updates
             metadata: Optional custom metadata
-            
+
         Returns:
             VerificationResult dictionary containing verification details
-            
+
         Example:
             >>> result = client.verify_document(
             ...     document_type="passport",
@@ -218,11 +694,11 @@ class IdswyftClient:
             ...     verification_id="verif_123",
             ...     user_id="user123"
             ... )
-            >>> print(result["status"])  # 'pending', 'verified', 'failed', or 'manual_review'
+            >>> print(result["status"])  # e.g. 'pending' or 'verified'
         """
         # Prepare form data
         data = {"document_type": document_type}
-        
+
         if verification_id:
             data["verification_id"] = verification_id
         if user_id:
@@ -230,14 +706,55 @@ class IdswyftClient:
         if webhook_url:
             data["webhook_url"] = webhook_url
         if metadata:
-            data["metadata"] = json.dumps(metadata)
-        
+            data["metadata"] = _dumps(metadata)
+
         # Prepare file
         file_tuple = self._prepare_file(document_file, "document")
         files = {"document": file_tuple}
-        
-        response = self._make_request("POST", "/api/verify/document", data=data, files=files)
-        return response.get("verification", response)
+
+        try:
+            response = self._make_request(
+                "POST", "/api/verify/document", data=data, files=files
+            )
+        finally:
+            # Close the handle _prepare_file opened for a path
+            if isinstance(document_file, str):
+                file_tuple[1].close()
+        return cast(VerificationResult, response.get("verification", response))
+
+    def verify_documents_bulk(
+        self,
+        items: List[Dict[str, Any]],
+        max_workers: int = 8,
+    ) -> List[VerificationResult]:
+        """
+        Verify several documents concurrently
+
+        Uploads run on a thread pool sharing this client's connection pool,
+        so a batch takes roughly as long as its slowest uploads rather than
+        the sum of all of them.
+
+        Args:
+            items: One dict of verify_document keyword arguments per document
+            max_workers: Maximum concurrent uploads (default: 8), capped at
+                the client's pool_size so every worker gets a pooled connection
+
+        Returns:
+            List of VerificationResult dictionaries, in the same order as items.
+            If any upload fails, its exception is raised once all uploads
+            have finished.
+
+        Example:
+            >>> results = client.verify_documents_bulk([
+            ...     {"document_type": "passport", "document_file": "a.jpg"},
+            ...     {"document_type": "drivers_license", "document_file": "b.jpg"},
+            ... ])
+        """
+        max_workers = max(1, min(max_workers, self.pool_size, len(items)))
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [executor.submit(self.verify_document, **item) for item in items]
+        return [future.result() for future in futures]
 
     def verify_back_of_id(
         self,
@@ -248,13 +765,13 @@ class IdswyftClient:
     ) -> VerificationResult:
         """
         Upload back-of-ID for enhanced verification with barcode scanning
-        
+
         Args:
             verification_id: Existing verification session ID
             document_type: Type of document
             back_of_id_file: Back of ID file (path, bytes, or file-like object)
             metadata: Optional custom metadata
-            
+
         Returns:
             VerificationResult dictionary with enhanced verification details
         """
@@ -262,48 +779,61 @@ class IdswyftClient:
             "verification_id": verification_id,
             "document_type": document_type,
         }
-        
+
         if metadata:
-            data["metadata"] = json.dumps(metadata)
-        
+            data["metadata"] = _dumps(metadata)
+
         # Prepare file
         file_tuple = self._prepare_file(back_of_id_file, "back_of_id")
         files = {"back_of_id": file_tuple}
-        
-        response = self._make_request("POST", "/api/verify/back-of-id", data=data, files=files)
-        return response
+
+        try:
+            response = self._make_request(
+                "POST", "/api/verify/back-of-id", data=data, files=files
+            )
+        finally:
+            if isinstance(back_of_id_file, str):
+                file_tuple[1].close()
+        return cast(VerificationResult, response)
 
     def live_capture(
         self,
         verification_id: str,
-        live_image_data: str,
+        live_image_data: Union[str, bytes, BinaryIO],
         challenge_response: Optional[str] = None,
         metadata: Optional[Dict[str, Any]] = None,
     ) -> VerificationResult:
         """
         Perform live capture with AI liveness detection
-        
+
         Args:
             verification_id: Existing verification session ID
-            live_image_data: Base64 encoded live image data
+            live_image_data: Base64 encoded live image data, or the raw image
+                as bytes or a file-like object. Raw images are uploaded as a
+                file, which skips base64 encoding and is a third smaller.
             challenge_response: Optional challenge response (blink, smile, etc.)
             metadata: Optional custom metadata
-            
+
         Returns:
             VerificationResult dictionary with liveness detection results
         """
-        data = {
-            "verification_id": verification_id,
-            "live_image_data": live_image_data,
-        }
-        
+        data = {"verification_id": verification_id}
+        files = None
+
+        if isinstance(live_image_data, str):
+            data["live_image_data"] = live_image_data
+        else:
+            files = {"live_image": self._prepare_file(live_image_data, "live_image")}
+
         if challenge_response:
             data["challenge_response"] = challenge_response
         if metadata:
-            data["metadata"] = json.dumps(metadata)
-        
-        response = self._make_request("POST", "/api/verify/live-capture", data=data)
-        return response
+            data["metadata"] = _dumps(metadata)
+
+        response = self._make_request(
+            "POST", "/api/verify/live-capture", data=data, files=files
+        )
+        return cast(VerificationResult, response)
 
     def generate_live_token(
         self,
@@ -312,34 +842,37 @@ class IdswyftClient:
     ) -> LiveTokenResponse:
         """
         Generate a secure token for live capture sessions
-        
+
         Args:
             verification_id: Existing verification session ID
-            challenge_type: Optional challenge type ('blink', 'smile', 'turn_head', 'random')
-            
+            challenge_type: Optional challenge type ('blink', 'smile',
+                'turn_head', 'random')
+
         Returns:
             LiveTokenResponse dictionary with token and challenge details
         """
         data = {"verification_id": verification_id}
-        
+
         if challenge_type:
             data["challenge_type"] = challenge_type
-        
-        response = self._make_request("POST", "/api/verify/generate-live-token", data=data)
-        return response
+
+        response = self._make_request(
+            "POST", "/api/verify/generate-live-token", data=data
+        )
+        return cast(LiveTokenResponse, response)
 
     def get_verification_results(self, verification_id: str) -> VerificationResult:
         """
         Get complete verification results including all enhancements
-        
+
         Args:
             verification_id: ID of the verification session
-            
+
         Returns:
             VerificationResult dictionary with comprehensive verification data
         """
         response = self._make_request("GET", f"/api/verify/results/{verification_id}")
-        return response
+        return cast(VerificationResult, response)
 
     def get_verification_history(
         self,
@@ -349,12 +882,12 @@ class IdswyftClient:
     ) -> Dict[str, Any]:
         """
         Get verification history for a user
-        
+
         Args:
             user_id: User identifier
             limit: Optional limit (default: 100, max: 1000)
             offset: Optional offset for pagination
-            
+
         Returns:
             Dictionary containing list of verifications and pagination info
         """
@@ -363,8 +896,10 @@ class IdswyftClient:
             params["limit"] = str(limit)
         if offset:
             params["offset"] = str(offset)
-        
-        return self._make_request("GET", f"/api/verify/history/{user_id}", params=params)
+
+        return self._make_request(
+            "GET", f"/api/verify/history/{user_id}", params=params
+        )
 
     def verify_selfie(
         self,
@@ -377,7 +912,7 @@ class IdswyftClient:
     ) -> VerificationResult:
         """
         Verify a selfie, optionally against a reference document
-        
+
         Args:
             selfie_file: Selfie file (path, bytes, or file-like object)
             verification_id: Optional verification session ID (from start_verification)
@@ -385,13 +920,13 @@ class IdswyftClient:
             user_id: Optional user identifier
             webhook_url: Optional webhook URL for status updates
             metadata: Optional custom metadata
-            
+
         Returns:
             VerificationResult dictionary containing verification details
         """
         # Prepare form data
         data = {}
-        
+
         if verification_id:
             data["verification_id"] = verification_id
         if reference_document_id:
@@ -401,27 +936,134 @@ class IdswyftClient:
         if webhook_url:
             data["webhook_url"] = webhook_url
         if metadata:
-            data["metadata"] = json.dumps(metadata)
-        
+            data["metadata"] = _dumps(metadata)
+
         # Prepare file
         file_tuple = self._prepare_file(selfie_file, "selfie")
         files = {"selfie": file_tuple}
-        
-        response = self._make_request("POST", "/api/verify/selfie", data=data, files=files)
-        return response.get("verification", response)
 
-    def get_verification_status(self, verification_id: str) -> VerificationResult:
+        try:
+            response = self._make_request(
+                "POST", "/api/verify/selfie", data=data, files=files
+            )
+        finally:
+            if isinstance(selfie_file, str):
+                file_tuple[1].close()
+        return cast(VerificationResult, response.get("verification", response))
+
+    def get_verification_status(
+        self,
+        verification_id: str,
+        cache: bool = False,
+    ) -> VerificationResult:
         """
         Get the current status of a verification request
-        
+
         Args:
             verification_id: ID of the verification request
-            
+            cache: If True, concurrent calls for the same ID share a single
+                request, and results in a final status ('verified' or
+                'failed') are kept and returned without contacting the API
+                again. 'manual_review' is always fetched, since a reviewer
+                decides it later. The same dict is handed to every caller,
+                so treat it as read-only.
+
         Returns:
             VerificationResult dictionary with current status
         """
+        if not cache:
+            return self._fetch_verification_status(verification_id)
+
+        with self._status_lock:
+            cached = self._status_cache.get(verification_id)
+            if cached is not None:
+                self._status_cache.move_to_end(verification_id)
+                return cached
+
+            inflight = self._status_inflight.get(verification_id)
+            if inflight is None:
+                future = self._status_inflight[verification_id] = Future()
+
+        # Another thread is already fetching this ID; wait for its result
+        if inflight is not None:
+            return inflight.result()
+
+        try:
+            verification = self._fetch_verification_status(verification_id)
+        except BaseException as e:
+            with self._status_lock:
+                del self._status_inflight[verification_id]
+            future.set_exception(e)
+            raise
+
+        with self._status_lock:
+            del self._status_inflight[verification_id]
+            if verification.get("status") in _FINAL_STATUSES:
+                self._status_cache[verification_id] = verification
+                if len(self._status_cache) > _STATUS_CACHE_SIZE:
+                    self._status_cache.popitem(last=False)
+        future.set_result(verification)
+
+        return verification
+
+    def _fetch_verification_status(self, verification_id: str) -> VerificationResult:
         response = self._make_request("GET", f"/api/verify/status/{verification_id}")
-        return response["verification"]
+        return cast(VerificationResult, response["verification"])
+
+    def wait_for_completion(
+        self,
+        verification_id: str,
+        timeout: float = 300,
+        initial: float = 0.5,
+        factor: float = 1.7,
+        max_interval: float = 15,
+    ) -> VerificationResult:
+        """
+        Block until a verification reaches a final status or manual review
+
+        Checks are spaced out with jittered exponential backoff, so quick
+        verifications return promptly while slow ones cost few requests.
+        When rate limited, waits at least as long as the API's retry_after.
+
+        Args:
+            verification_id: ID of the verification request
+            timeout: Maximum number of seconds to wait
+            initial: Seconds of backoff after the first check; each wait is
+                a random 50-100% of the current backoff
+            factor: Multiplier applied to the wait after each check
+            max_interval: Upper bound on the wait between checks
+
+        Returns:
+            VerificationResult in a final status ('verified', 'failed'), or
+            'manual_review' if the verification is waiting on a reviewer
+
+        Raises:
+            IdswyftTimeoutError: If the verification is still in progress
+                after timeout seconds
+        """
+        deadline = time.monotonic() + timeout
+        interval = initial
+
+        while True:
+            # Each wait is a random 50-100% of the backoff interval, so
+            # clients that started together don't keep polling in step
+            delay = interval * random.uniform(0.5, 1.0)
+            try:
+                verification = self.get_verification_status(verification_id, cache=True)
+                if verification.get("status") in _TERMINAL_STATUSES:
+                    return verification
+                interval = min(interval * factor, max_interval)
+            except IdswyftRateLimitError as e:
+                delay = max(delay, e.retry_after or 0)
+
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise IdswyftTimeoutError(
+                    f"Verification {verification_id} did not complete "
+                    f"within {timeout} seconds",
+                    verification_id=verification_id,
+                )
+            time.sleep(min(delay, remaining))
 
     def list_verifications(
         self,
@@ -432,50 +1074,103 @@ class IdswyftClient:
     ) -> ListVerificationsResponse:
         """
         List verification requests
-        
+
         Args:
             status: Optional status filter
             limit: Optional limit (default: 100, max: 1000)
             offset: Optional offset for pagination
             user_id: Optional user ID filter
-            
+
         Returns:
             Dictionary containing list of verifications and pagination info
         """
-        params = {}
-        if status:
-            params["status"] = status
-        if limit:
-            params["limit"] = str(limit)
-        if offset:
-            params["offset"] = str(offset)
-        if user_id:
-            params["user_id"] = user_id
-        
-        return self._make_request("GET", "/api/verify/list", params=params)
+        # Unset filters are left out; the HTTP library stringifies ints
+        params = {
+            name: value
+            for name, value in (
+                ("status", status),
+                ("limit", limit),
+                ("offset", offset),
+                ("user_id", user_id),
+            )
+            if value
+        }
+
+        response = self._make_request("GET", "/api/verify/list", params=params)
+        return cast(ListVerificationsResponse, response)
+
+    def iter_verifications(
+        self,
+        page_size: int = 100,
+        status: Optional[str] = None,
+        user_id: Optional[str] = None,
+    ) -> Iterator[VerificationResult]:
+        """
+        Iterate over all verifications, one page request at a time
+
+        The next page is fetched in the background while the current one is
+        being consumed, so a full scan doesn't wait a round trip per page.
+
+        Args:
+            page_size: Verifications per request (max: 1000)
+            status: Optional status filter
+            user_id: Optional user ID filter
+
+        Yields:
+            VerificationResult dictionaries
+        """
+        # Larger pages would come back short and look like the last one
+        page_size = min(page_size, _MAX_PAGE_SIZE)
+        offset = 0
+        page = self.list_verifications(
+            status=status, limit=page_size, offset=offset, user_id=user_id
+        )
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            while True:
+                verifications = page.get("verifications", [])
+                offset += len(verifications)
+
+                next_page = None
+                if _has_next_page(page, page_size, offset):
+                    next_page = executor.submit(
+                        self.list_verifications,
+                        status=status,
+                        limit=page_size,
+                        offset=offset,
+                        user_id=user_id,
+                    )
+
+                yield from verifications
+
+                if next_page is None:
+                    return
+                page = next_page.result()
 
     def update_webhook(self, verification_id: str, webhook_url: str) -> Dict[str, bool]:
         """
         Update webhook URL for a verification
-        
+
         Args:
             verification_id: ID of the verification request
             webhook_url: New webhook URL
-            
+
         Returns:
             Dictionary with success status
         """
         data = {"webhook_url": webhook_url}
-        return self._make_request("PATCH", f"/api/verify/{verification_id}/webhook", data=data)
+        return self._make_request(
+            "PATCH", f"/api/verify/{verification_id}/webhook", data=data
+        )
 
     def register_developer(self, email: str, name: str) -> Dict[str, str]:
         """
         Register as a new developer
-        
+
         Args:
             email: Developer email address
             name: Developer name
-            
+
         Returns:
             Dictionary with developer_id and message
         """
@@ -485,11 +1180,11 @@ class IdswyftClient:
     def create_api_key(self, name: str, environment: str) -> Dict[str, str]:
         """
         Create a new API key
-        
+
         Args:
             name: API key name/description
             environment: Environment ('sandbox' or 'production')
-            
+
         Returns:
             Dictionary with api_key and key_id
         """
@@ -499,7 +1194,7 @@ class IdswyftClient:
     def list_api_keys(self) -> Dict[str, list]:
         """
         List all API keys
-        
+
         Returns:
             Dictionary with api_keys list
         """
@@ -508,10 +1203,10 @@ class IdswyftClient:
     def revoke_api_key(self, key_id: str) -> Dict[str, Any]:
         """
         Revoke/delete an API key
-        
+
         Args:
             key_id: API key ID to revoke
-            
+
         Returns:
             Dictionary with success status and message
         """
@@ -526,13 +1221,13 @@ class IdswyftClient:
     ) -> Dict[str, Any]:
         """
         Get API activity logs
-        
+
         Args:
             limit: Optional limit (default: 100, max: 1000)
             offset: Optional offset for pagination
             start_date: Optional start date filter (ISO format)
             end_date: Optional end date filter (ISO format)
-            
+
         Returns:
             Dictionary containing activities and pagination info
         """
@@ -545,7 +1240,7 @@ class IdswyftClient:
             params["start_date"] = start_date
         if end_date:
             params["end_date"] = end_date
-        
+
         return self._make_request("GET", "/api/developer/activity", params=params)
 
     def register_webhook(
@@ -556,27 +1251,27 @@ class IdswyftClient:
     ) -> Dict[str, Any]:
         """
         Register a webhook URL
-        
+
         Args:
             url: Webhook URL
             events: Optional list of events to subscribe to
             secret: Optional webhook secret for signature verification
-            
+
         Returns:
             Dictionary with webhook information
         """
-        data = {"url": url}
+        data: Dict[str, Any] = {"url": url}
         if events:
             data["events"] = events
         if secret:
             data["secret"] = secret
-        
+
         return self._make_request("POST", "/api/webhooks/register", data=data)
 
     def list_webhooks(self) -> Dict[str, list]:
         """
         List all webhooks
-        
+
         Returns:
             Dictionary with webhooks list
         """
@@ -591,33 +1286,33 @@ class IdswyftClient:
     ) -> Dict[str, Any]:
         """
         Update a webhook
-        
+
         Args:
             webhook_id: Webhook ID to update
             url: Optional new webhook URL
             events: Optional new events list
             secret: Optional new webhook secret
-            
+
         Returns:
             Dictionary with updated webhook information
         """
-        data = {}
+        data: Dict[str, Any] = {}
         if url:
             data["url"] = url
         if events is not None:
             data["events"] = events
         if secret is not None:
             data["secret"] = secret
-        
+
         return self._make_request("PUT", f"/api/webhooks/{webhook_id}", data=data)
 
     def delete_webhook(self, webhook_id: str) -> Dict[str, Any]:
         """
         Delete a webhook
-        
+
         Args:
             webhook_id: Webhook ID to delete
-            
+
         Returns:
             Dictionary with success status and message
         """
@@ -626,10 +1321,10 @@ class IdswyftClient:
     def test_webhook(self, webhook_id: str) -> Dict[str, Any]:
         """
         Test webhook delivery
-        
+
         Args:
             webhook_id: Webhook ID to test
-            
+
         Returns:
             Dictionary with success status and delivery_id
         """
@@ -643,12 +1338,12 @@ class IdswyftClient:
     ) -> Dict[str, Any]:
         """
         Get webhook delivery history
-        
+
         Args:
             webhook_id: Webhook ID
             limit: Optional limit (default: 100, max: 1000)
             offset: Optional offset for pagination
-            
+
         Returns:
             Dictionary containing deliveries and pagination info
         """
@@ -657,22 +1352,25 @@ class IdswyftClient:
             params["limit"] = str(limit)
         if offset:
             params["offset"] = str(offset)
-        
-        return self._make_request("GET", f"/api/webhooks/{webhook_id}/deliveries", params=params)
+
+        return self._make_request(
+            "GET", f"/api/webhooks/{webhook_id}/deliveries", params=params
+        )
 
     def get_usage_stats(self) -> UsageStats:
         """
         Get developer usage statistics
-        
+
         Returns:
             UsageStats dictionary with usage information
         """
-        return self._make_request("GET", "/api/developer/stats")
+        response = self._make_request("GET", "/api/developer/stats")
+        return cast(UsageStats, response)
 
     def health_check(self) -> Dict[str, str]:
         """
         Check API health status
-        
+
         Returns:
             Dictionary with status and timestamp
         """
@@ -683,20 +1381,25 @@ class IdswyftClient:
             return {"status": "ok", "timestamp": ""}
 
     @staticmethod
-    def verify_webhook_signature(payload: str, signature: str, secret: str) -> bool:
+    def verify_webhook_signature(
+        payload: Union[str, bytes],
+        signature: Union[str, bytes],
+        secret: Union[str, bytes],
+    ) -> bool:
         """
         Verify webhook signature for security
-        
+
         Args:
-            payload: Raw webhook payload string
-            signature: Signature from X-Idswyft-Signature header
-            secret: Your webhook secret
-            
+            payload: Raw webhook payload, as bytes or a UTF-8 string. Passing
+                the raw request body as bytes avoids a decode/encode round trip.
+            signature: Signature from X-Idswyft-Signature header, as str or bytes
+            secret: Your webhook secret, as str or bytes
+
         Returns:
             True if signature is valid, False otherwise
-            
+
         Example:
-            >>> payload = request.get_data(as_text=True)
+            >>> payload = request.get_data()
             >>> signature = request.headers.get("X-Idswyft-Signature")
             >>> if IdswyftClient.verify_webhook_signature(payload, signature, secret):
             ...     # Process webhook
@@ -704,22 +1407,27 @@ class IdswyftClient:
         """
         if not all([payload, signature, secret]):
             return False
-        
-        try:
-            # Remove 'sha256=' prefix if present
-            signature = signature.replace("sha256=", "")
-            
-            # Calculate expected signature
-            expected = hmac.new(
-                secret.encode("utf-8"),
-                payload.encode("utf-8"),
-                hashlib.sha256
-            ).hexdigest()
-            
-            # Use hmac.compare_digest for timing-safe comparison
-            return hmac.compare_digest(expected, signature)
-        except Exception:
-            return False
+
+        return WebhookVerifier(secret).verify(payload, signature)
+
+    @staticmethod
+    def webhook_verifier(secret: Union[str, bytes]) -> WebhookVerifier:
+        """
+        Create a reusable verifier for a fixed webhook secret
+
+        Args:
+            secret: Your webhook secret
+
+        Returns:
+            WebhookVerifier whose verify(payload, signature) method behaves
+            like verify_webhook_signature
+
+        Example:
+            >>> verifier = IdswyftClient.webhook_verifier(secret)
+            >>> if verifier.verify(request.get_data(), signature):
+            ...     pass
+        """
+        return WebhookVerifier(secret)
 
     def __enter__(self):
         """Context manager entry"""
@@ -731,4 +1439,4 @@ class IdswyftClient:
 
     def close(self):
         """Close the HTTP session"""
-        self.session.close()
\ No newline at end of file
+        self.session.close()
@@ -1,5 +1,9 @@
 """
 Type definitions for the Idswyft SDK
+
+These are TypedDicts, so they only exist for type checkers: API responses
+are returned as the plain dicts produced by the JSON decoder, with no
+per-object wrapper or conversion pass.
 """
 
 from typing import Dict, Any, Optional, Literal, Union, BinaryIO
@@ -22,6 +26,7 @@ FileData = Union[str, bytes, BinaryIO]
 
 class OCRData(TypedDict, total=False):
     """OCR extraction results from document analysis"""
+
     name: Optional[str]
     date_of_birth: Optional[str]
     document_number: Optional[str]
@@ -35,6 +40,7 @@ class OCRData(TypedDict, total=False):
 
 class QualityAnalysisResolution(TypedDict):
     """Resolution information from quality analysis"""
+
     width: int
     height: int
     isHighRes: bool
@@ -42,12 +48,14 @@ class QualityAnalysisResolution(TypedDict):
 
 class QualityAnalysisFileSize(TypedDict):
     """File size information from quality analysis"""
+
     bytes: int
     isReasonableSize: bool
 
 
 class QualityAnalysis(TypedDict, total=False):
     """Document quality analysis results"""
+
     isBlurry: bool
     blurScore: float
     brightness: float
@@ -61,6 +69,7 @@ class QualityAnalysis(TypedDict, total=False):
 
 class BarcodeData(TypedDict, total=False):
     """Barcode/QR code scanning results"""
+
     qr_code: Optional[str]
     parsed_data: Optional[Dict[str, Any]]
     verification_codes: Optional[list[str]]
@@ -69,6 +78,7 @@ class BarcodeData(TypedDict, total=False):
 
 class CrossValidationResults(TypedDict):
     """Cross-validation results between front and back of ID"""
+
     match_score: float
     validation_results: Dict[str, bool]
     discrepancies: list[str]
@@ -76,6 +86,7 @@ class CrossValidationResults(TypedDict):
 
 class LivenessDetails(TypedDict, total=False):
     """Detailed liveness detection analysis"""
+
     blink_detection: Optional[float]
     head_movement: Optional[float]
     texture_analysis: Optional[float]
@@ -84,6 +95,7 @@ class LivenessDetails(TypedDict, total=False):
 
 class VerificationResult(TypedDict, total=False):
     """Result of a verification request"""
+
     id: str
     verification_id: Optional[str]
     status: VerificationStatus
@@ -118,12 +130,14 @@ class VerificationResult(TypedDict, total=False):
 
 class StartVerificationRequest(TypedDict):
     """Request parameters for starting verification"""
+
     user_id: str
     sandbox: Optional[bool]
 
 
 class StartVerificationResponse(TypedDict):
     """Response from start verification endpoint"""
+
     verification_id: str
     status: str
     user_id: str
@@ -133,6 +147,7 @@ class StartVerificationResponse(TypedDict):
 
 class DocumentVerificationRequest(TypedDict, total=False):
     """Request parameters for document verification"""
+
     verification_id: Optional[str]  # For existing verification session
     document_type: DocumentType
     document_file: FileData
@@ -143,6 +158,7 @@ class DocumentVerificationRequest(TypedDict, total=False):
 
 class BackOfIdRequest(TypedDict):
     """Request parameters for back-of-ID verification"""
+
     verification_id: str
     document_type: DocumentType
     back_of_id_file: FileData
@@ -151,6 +167,7 @@ class BackOfIdRequest(TypedDict):
 
 class LiveCaptureRequest(TypedDict):
     """Request parameters for live capture"""
+
     verification_id: str
     live_image_data: str  # base64 encoded
     challenge_response: Optional[str]
@@ -159,12 +176,14 @@ class LiveCaptureRequest(TypedDict):
 
 class LiveTokenRequest(TypedDict):
     """Request parameters for live token generation"""
+
     verification_id: str
     challenge_type: Optional[ChallengeType]
 
 
 class LiveTokenResponse(TypedDict):
     """Response from live token generation"""
+
     token: str
     challenge: str
     expires_at: str
@@ -173,6 +192,7 @@ class LiveTokenResponse(TypedDict):
 
 class SelfieVerificationRequest(TypedDict, total=False):
     """Request parameters for selfie verification"""
+
     verification_id: Optional[str]  # For existing verification session
     selfie_file: FileData
     reference_document_id: Optional[str]
@@ -183,6 +203,7 @@ class SelfieVerificationRequest(TypedDict, total=False):
 
 class ApiKey(TypedDict):
     """API key information"""
+
     id: str
     name: str
     key_prefix: str
@@ -195,12 +216,14 @@ class ApiKey(TypedDict):
 
 class CreateApiKeyRequest(TypedDict):
     """Request parameters for creating API key"""
+
     name: str
     environment: Environment
 
 
 class Webhook(TypedDict):
     """Webhook information"""
+
     id: str
     url: str
     events: list[str]
@@ -212,6 +235,7 @@ class Webhook(TypedDict):
 
 class CreateWebhookRequest(TypedDict, total=False):
     """Request parameters for creating webhook"""
+
     url: str
     events: Optional[list[str]]
     secret: Optional[str]
@@ -219,6 +243,7 @@ class CreateWebhookRequest(TypedDict, total=False):
 
 class UsageStats(TypedDict):
     """Developer usage statistics"""
+
     period: str
     total_requests: int
     successful_requests: int
@@ -234,6 +259,7 @@ class UsageStats(TypedDict):
 
 class ListVerificationsResponse(TypedDict):
     """Response from list verifications endpoint"""
+
     verifications: list[VerificationResult]
     total: int
     limit: int
@@ -242,6 +268,7 @@ class ListVerificationsResponse(TypedDict):
 
 class ApiKeyInfo(TypedDict, total=False):
     """API key information"""
+
     id: str
     name: str
     key_preview: str
@@ -255,10 +282,11 @@ class ApiKeyInfo(TypedDict, total=False):
 
 class WebhookEvent(TypedDict, total=False):
     """Webhook event payload"""
+
     event_type: str
     verification_id: str
     status: VerificationStatus
     confidence_score: Optional[float]
     user_id: Optional[str]
     timestamp: str
-    metadata: Optional[Dict[str, Any]]
\ No newline at end of file
+    metadata: Optional[Dict[str, Any]]
@@ -8,7 +8,7 @@ long_description = (here / "README.md").read_text(encoding="utf-8")
 
 setup(
     name="idswyft",
-    version="1.0.0",
+    version="2.0.0",
     author="Idswyft Team",
     author_email="support@idswyft.com",
     description="Official Python SDK for the Idswyft identity verification platform",
@@ -45,6 +45,7 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "black>=22.0.0",
             "flake8>=5.0.0",
             "mypy>=0.991",
@@ -53,8 +54,16 @@ setup(
         "test": [
             "pytest>=7.0.0",
             "pytest-cov>=4.0.0",
+            "pytest-xdist>=3.0.0",
             "responses>=0.21.0",
         ],
+        "speedups": [
+            "orjson>=3.9.0",
+            "requests-toolbelt>=1.0.0",
+        ],
+        "async": [
+            "httpx[http2]>=0.24.0",
+        ],
     },
     package_data={
         "idswyft": ["py.typed"],
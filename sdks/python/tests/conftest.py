@@ -0,0 +1,79 @@
+"""
+Shared fixtures for the Idswyft Python SDK tests
+"""
+
+import hmac
+import hashlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
+
+import pytest
+
+from idswyft import IdswyftClient
+
+from fakes import FakeResponse
+
+
+@pytest.fixture(scope='session')
+def webhook_case():
+    """A webhook payload, its valid signature header and the signing secret"""
+    payload = '{"verification_id":"test","status":"verified"}'
+    secret = 'webhook-secret'
+    signature = 'sha256=' + hmac.new(
+        secret.encode('utf-8'),
+        payload.encode('utf-8'),
+        hashlib.sha256
+    ).hexdigest()
+    return payload, signature, secret
+
+
+@pytest.fixture(scope='session')
+def tmp_data_file(tmp_path_factory):
+    """Path of a small JPEG-named file, written once per test session"""
+    path = tmp_path_factory.mktemp('files') / 'document.jpg'
+    path.write_bytes(b'test file content')
+    return str(path)
+
+
+@pytest.fixture
+def mock_session(monkeypatch):
+    """Mock standing in for the requests.Session of every client built in the test"""
+    # Built fresh for each test so nothing a test sets on it can leak into
+    # the next one; replies default to an empty JSON 200
+    session = Mock()
+    session.request.return_value = FakeResponse()
+    monkeypatch.setattr('idswyft.client.requests.Session', lambda: session)
+    # Send uploads as plain files= even when requests-toolbelt is installed;
+    # the streaming test patches MultipartEncoder back in
+    monkeypatch.setattr('idswyft.client.MultipartEncoder', None)
+    return session
+
+
+@pytest.fixture
+def mock_async_session(monkeypatch):
+    """AsyncMock standing in for the httpx.AsyncClient of every async client built in the test"""
+    session = AsyncMock()
+    session.request.return_value = FakeResponse()
+    # Tests read the client options from httpx.AsyncClient.call_args
+    monkeypatch.setattr('idswyft.async_client.httpx.AsyncClient', Mock(return_value=session))
+    return session
+
+
+@pytest.fixture
+def mock_client(mock_session):
+    """A client on a mocked session; tests set the reply on ``session.request``"""
+    return SimpleNamespace(
+        client=IdswyftClient(api_key='test-key'),
+        session=mock_session
+    )
+
+
+@pytest.fixture(scope='module')
+def client():
+    """One sandbox client per module, for tests that never send a request"""
+    with IdswyftClient(
+        api_key='test-api-key',
+        base_url='https://api.test.idswyft.com',
+        sandbox=True
+    ) as client:
+        yield client
@@ -0,0 +1,23 @@
+"""
+Stand-ins for HTTP objects shared by the Idswyft Python SDK tests
+"""
+
+import json
+
+
+class FakeResponse:
+    """Bare stand-in for requests.Response with only what the client reads"""
+    
+    __slots__ = ('status_code', 'headers', 'content')
+    
+    def __init__(self, body=None, status_code=200, headers=None):
+        self.status_code = status_code
+        self.headers = {'Content-Type': 'application/json; charset=utf-8'} if headers is None else headers
+        self.content = b'' if body is None else json.dumps(body).encode()
+    
+    @property
+    def text(self):
+        return self.content.decode('utf-8')
+    
+    def json(self):
+        return json.loads(self.content)
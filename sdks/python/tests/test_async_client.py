@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Async client tests for Idswyft Python SDK
+"""
+
+import pytest
+import asyncio
+from unittest.mock import patch, AsyncMock
+
+# The async client needs the optional async extra
+httpx = pytest.importorskip('httpx')
+
+import idswyft
+from idswyft import IdswyftAsyncClient
+from idswyft.exceptions import IdswyftRateLimitError
+
+from fakes import FakeResponse
+
+class TestIdswyftAsyncClient:
+    """Test cases for IdswyftAsyncClient class"""
+    
+    def test_client_initialization_requires_api_key(self):
+        """Test that client initialization requires API key"""
+        with pytest.raises(ValueError, match="API key is required"):
+            IdswyftAsyncClient(api_key='')
+    
+    def test_async_alias(self):
+        """Test AsyncIdswyftClient is an alias of IdswyftAsyncClient"""
+        assert idswyft.AsyncIdswyftClient is IdswyftAsyncClient
+    
+    def test_register_webhook(self, mock_async_session):
+        """Test webhook management methods are mirrored on the async client"""
+        mock_async_session.request.return_value = FakeResponse({
+            'webhook': {'id': 'webhook_123', 'url': 'https://example.com/webhook'}
+        }, status_code=201)
+        
+        client = IdswyftAsyncClient(api_key='test-key', pool_size=5)
+        
+        result = asyncio.run(client.register_webhook(url='https://example.com/webhook'))
+        
+        assert result['webhook']['id'] == 'webhook_123'
+        call_kwargs = mock_async_session.request.call_args.kwargs
+        assert call_kwargs['url'] == 'https://api.idswyft.com/api/webhooks/register'
+        limits = httpx.AsyncClient.call_args.kwargs['limits']
+        assert limits.max_connections == 5
+    
+    def test_verify_document(self, mock_async_session):
+        """Test document verification is awaited through the async session"""
+        mock_async_session.request.return_value = FakeResponse({
+            'verification': {'id': 'verif_123', 'status': 'pending', 'type': 'document'}
+        })
+        
+        async def run():
+            async with IdswyftAsyncClient(api_key='test-key') as client:
+                return await client.verify_document(
+                    document_type='passport',
+                    document_file=b'fake image data'
+                )
+        
+        result = asyncio.run(run())
+        
+        assert result['id'] == 'verif_123'
+        call_kwargs = mock_async_session.request.call_args.kwargs
+        assert call_kwargs['method'] == 'POST'
+        assert call_kwargs['url'] == 'https://api.idswyft.com/api/verify/document'
+        assert call_kwargs['files'] == {
+            'document': ('document', b'fake image data', 'application/octet-stream')
+        }
+        mock_async_session.aclose.assert_awaited_once()
+    
+    def test_error_handling_429(self, mock_async_session):
+        """Test rate limit errors map to the same exceptions as the sync client"""
+        mock_async_session.request.return_value = FakeResponse({
+            'message': 'Rate limit exceeded',
+            'retry_after': 60
+        }, status_code=429)
+        
+        client = IdswyftAsyncClient(api_key='test-key')
+        
+        with pytest.raises(IdswyftRateLimitError) as exc_info:
+            asyncio.run(client.get_verification_status('verif_123'))
+        
+        assert exc_info.value.retry_after == 60
+    
+    def test_iter_verifications(self, mock_async_session):
+        """Test async iteration stops on a short page"""
+        first = FakeResponse({
+            'verifications': [{'id': 'verif_1'}, {'id': 'verif_2'}], 'limit': 2, 'offset': 0
+        })
+        last = FakeResponse({
+            'verifications': [{'id': 'verif_3'}], 'limit': 2, 'offset': 2
+        })
+        
+        mock_async_session.request.side_effect = [first, last]
+        
+        client = IdswyftAsyncClient(api_key='test-key')
+        
+        async def run():
+            return [v['id'] async for v in client.iter_verifications(page_size=2)]
+        
+        assert asyncio.run(run()) == ['verif_1', 'verif_2', 'verif_3']
+        assert mock_async_session.request.call_count == 2
+    
+    @patch('idswyft.async_client.random.uniform', return_value=0.5)
+    @patch('idswyft.async_client.asyncio.sleep', new_callable=AsyncMock)
+    def test_wait_for_completion(self, mock_sleep, mock_uniform, mock_async_session):
+        """Test waiting sleeps with asyncio.sleep between checks"""
+        pending = FakeResponse({'verification': {'id': 'verif_123', 'status': 'pending'}})
+        done = FakeResponse({'verification': {'id': 'verif_123', 'status': 'failed'}})
+        
+        mock_async_session.request.side_effect = [pending, done]
+        
+        client = IdswyftAsyncClient(api_key='test-key')
+        result = asyncio.run(client.wait_for_completion('verif_123', initial=0.5))
+        
+        assert result['status'] == 'failed'
+        mock_sleep.assert_awaited_once_with(0.25)
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
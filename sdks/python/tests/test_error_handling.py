@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Error handling tests for Idswyft Python SDK
+"""
+
+import pytest
+from unittest.mock import patch
+
+from idswyft.exceptions import (
+    IdswyftAuthenticationError, IdswyftValidationError, IdswyftNotFoundError,
+    IdswyftRateLimitError, IdswyftServerError
+)
+
+from fakes import FakeResponse
+
+# (status, response body, client method, its kwargs, exception, message, retry_after)
+ERROR_CASES = [
+    (400, {'message': 'Validation failed', 'field': 'document_type', 'details': ['Invalid document type']},
+     'verify_document', {'document_type': 'invalid', 'document_file': b'test'},
+     IdswyftValidationError, 'Validation failed', None),
+    (401, {'message': 'Invalid API key'},
+     'health_check', {},
+     IdswyftAuthenticationError, 'Invalid API key', None),
+    (404, {'message': 'Verification not found', 'resource': 'Verification'},
+     'get_verification_results', {'verification_id': 'invalid-id'},
+     IdswyftNotFoundError, 'Verification', None),
+    (429, {'message': 'Rate limit exceeded', 'retry_after': 60},
+     'verify_document', {'document_type': 'passport', 'document_file': b'test'},
+     IdswyftRateLimitError, 'Rate limit exceeded', 60),
+    (500, {'message': 'Internal server error'},
+     'health_check', {},
+     IdswyftServerError, 'Internal server error', None),
+]
+
+class TestErrorHandling:
+    """Test HTTP error responses map to SDK exceptions"""
+    
+    @pytest.mark.parametrize('status,payload,method,kwargs,exc,msg,retry_after', ERROR_CASES)
+    def test_http_error(self, mock_client, status, payload, method, kwargs, exc, msg, retry_after):
+        """Test each HTTP error status raises its exception type"""
+        mock_client.session.request.return_value = FakeResponse(payload, status_code=status)
+        
+        with pytest.raises(exc) as exc_info:
+            getattr(mock_client.client, method)(**kwargs)
+        
+        assert msg in str(exc_info.value)
+        if retry_after is not None:
+            assert exc_info.value.retry_after == retry_after
+    
+    @patch.object(FakeResponse, 'json')
+    def test_error_handling_html_body(self, mock_json, mock_client):
+        """Test gateway HTML error pages are not parsed and are truncated"""
+        response = FakeResponse(status_code=502, headers={'Content-Type': 'text/html'})
+        response.content = b'<html>' + b'x' * 5000 + b'</html>'
+        mock_client.session.request.return_value = response
+        
+        with pytest.raises(IdswyftServerError) as exc_info:
+            mock_client.client.list_verifications()
+        
+        assert len(exc_info.value.message) == 2048
+        mock_json.assert_not_called()
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,63 @@
+#!/usr/bin/env python3
+"""
+File preparation tests for Idswyft Python SDK
+"""
+
+import io
+
+import pytest
+
+from idswyft.exceptions import IdswyftValidationError
+
+
+@pytest.fixture
+def upload_source(request, tmp_path):
+    """Upload data of the kind named by the parameter: bytes, file or path"""
+    if request.param == 'path':
+        path = tmp_path / 'document.jpg'
+        path.write_bytes(b'test file content')
+        return str(path)
+    if request.param == 'file':
+        return io.BytesIO(b'test file content')
+    return b'test image data'
+
+
+class TestFilePreparation:
+    """Test upload data is normalised by _prepare_file"""
+    
+    @pytest.mark.parametrize('upload_source,content,content_type', [
+        ('bytes', b'test image data', 'application/octet-stream'),
+        # No name to guess a content type from
+        ('file', b'test file content', 'application/octet-stream'),
+        pytest.param('path', b'test file content', 'image/jpeg', marks=pytest.mark.slow),
+    ], indirect=['upload_source'])
+    def test_file_preparation(self, client, upload_source, content, content_type):
+        """Test file preparation from bytes, a file object and a file path"""
+        field, data, mime_type = client._prepare_file(upload_source, 'test_field')
+        if not isinstance(data, bytes):
+            # Files are passed on as open handles, not read up front
+            with data as handle:
+                data = handle.read()
+        
+        assert (field, data, mime_type) == ('test_field', content, content_type)
+    
+    def test_file_preparation_too_large(self, client):
+        """Test files over the API upload limit are rejected before sending"""
+        with pytest.raises(IdswyftValidationError, match="limited to 10 MB") as exc_info:
+            client._prepare_file(b'0' * (10 * 1024 * 1024 + 1), 'document')
+        assert exc_info.value.field == 'document'
+        
+        # File-like objects are measured from their current position
+        large_file = io.BytesIO(b'0' * (10 * 1024 * 1024 + 1))
+        large_file.seek(1)
+        result = client._prepare_file(large_file, 'document')
+        assert result[1].tell() == 1
+    
+    def test_file_preparation_invalid_type(self, client):
+        """Test file preparation with invalid type"""
+        with pytest.raises(ValueError, match="Invalid file data type"):
+            client._prepare_file(12345, 'test_field')
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Client initialization tests for Idswyft Python SDK
+"""
+
+import pytest
+from unittest.mock import Mock, patch
+import socket
+
+import idswyft.client
+from idswyft import IdswyftClient
+
+from fakes import FakeResponse
+
+class TestClientInitialization:
+    """Test IdswyftClient construction and transport setup"""
+    
+    @pytest.mark.parametrize('kwargs,expected', [
+        # Default values
+        (
+            {'api_key': 'test-key'},
+            {'base_url': 'https://api.idswyft.com', 'timeout': 30, 'sandbox': False}
+        ),
+        # Provided config
+        (
+            {'api_key': 'test-api-key', 'base_url': 'http://localhost:3001', 'timeout': 60, 'sandbox': True},
+            {'base_url': 'http://localhost:3001', 'timeout': 60, 'sandbox': True}
+        ),
+    ])
+    def test_client_initialization(self, kwargs, expected):
+        """Test client initialization with provided config"""
+        client = IdswyftClient(**kwargs)
+        
+        assert client.api_key == kwargs['api_key']
+        for name, value in expected.items():
+            assert getattr(client, name) == value
+    
+    def test_client_initialization_requires_api_key(self):
+        """Test that client initialization requires API key"""
+        with pytest.raises(ValueError, match="API key is required"):
+            IdswyftClient(api_key='')
+    
+    def test_client_connection_pool(self):
+        """Test the session adapter uses the configured pool size and retries"""
+        client = IdswyftClient(api_key='test-key', pool_size=50, max_retries=5)
+        adapter = client.session.get_adapter('https://api.idswyft.com')
+        
+        assert adapter._pool_maxsize == 50
+        assert adapter.max_retries.total == 5
+        assert 502 in adapter.max_retries.status_forcelist
+        assert client.session.get_adapter('http://localhost') is adapter
+        
+        socket_options = adapter.poolmanager.connection_pool_kw['socket_options']
+        assert (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1) in socket_options
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in socket_options
+    
+    def test_client_initialization_invalid_transport(self):
+        """Test that an unknown transport is rejected"""
+        with pytest.raises(ValueError, match="Unsupported transport"):
+            IdswyftClient(api_key='test-key', transport='urllib')
+    
+    @pytest.mark.skipif(idswyft.client.httpx is None, reason="httpx is not installed")
+    @patch('idswyft.client.httpx.Client')
+    def test_httpx_transport(self, mock_client_class):
+        """Test requests are sent through httpx when selected"""
+        mock_session = Mock()
+        mock_session.request.return_value = FakeResponse({
+            'verification': {'id': 'verif_123', 'status': 'pending'}
+        })
+        mock_client_class.return_value = mock_session
+
+        client = IdswyftClient(api_key='test-key', transport='httpx')
+
+        result = client.get_verification_status('verif_123')
+
+        assert result['id'] == 'verif_123'
+        mock_session.request.assert_called_once_with(
+            method='GET',
+            url='https://api.idswyft.com/api/verify/status/verif_123',
+            data=None,
+            files=None,
+            params=None,
+            headers=None,
+            timeout=30
+        )
+        assert mock_client_class.call_args.kwargs['headers']['X-API-Key'] == 'test-key'
+    
+    def test_context_manager(self):
+        """Test client as context manager"""
+        with IdswyftClient(api_key='test-key') as client:
+            assert client.api_key == 'test-key'
+            # Session should be accessible
+            assert client.session is not None
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
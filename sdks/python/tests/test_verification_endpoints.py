@@ -0,0 +1,459 @@
+#!/usr/bin/env python3
+"""
+Verification endpoint tests for Idswyft Python SDK
+"""
+
+import pytest
+import json
+from unittest.mock import Mock, patch
+
+from idswyft import IdswyftClient
+from idswyft.exceptions import IdswyftTimeoutError
+
+from fakes import FakeResponse
+
+# Response bodies returned by the mocked API
+_RESP_START_VERIFICATION = {
+    'verification_id': 'verif_123',
+    'status': 'started',
+    'user_id': 'user-123',
+    'next_steps': ['Upload document'],
+    'created_at': '2024-01-01T12:00:00Z'
+}
+_RESP_VERIFY_DOC = {
+    'id': 'verif_123',
+    'status': 'processing',
+    'type': 'document',
+    'ocr_data': {
+        'name': 'John Doe',
+        'confidence_scores': {'name': 0.95}
+    },
+    'quality_analysis': {
+        'overallQuality': 'good'
+    }
+}
+_RESP_VERIFY_BACK = {
+    'verification_id': 'verif_123',
+    'status': 'processing',
+    'enhanced_verification': {
+        'barcode_scanning_enabled': True,
+        'cross_validation_enabled': True,
+        'ai_powered': True
+    },
+    'barcode_data': {
+        'parsed_data': {'license_number': 'D12345678'}
+    }
+}
+_RESP_LIVE_CAPTURE = {
+    'id': 'verif_live123',
+    'status': 'verified',
+    'type': 'live_capture',
+    'liveness_score': 0.94,
+    'face_match_score': 0.92,
+    'confidence_score': 0.93,
+    'liveness_details': {
+        'blink_detection': 0.95,
+        'challenge_passed': True
+    }
+}
+_RESP_LIVE_TOKEN = {
+    'token': 'live_token_xyz789',
+    'challenge': 'smile',
+    'expires_at': '2024-01-01T12:05:00Z',
+    'instructions': 'Please smile naturally for the camera'
+}
+_RESP_API_KEY = {
+    'api_key': 'sk_test_123456789abcdef',
+    'key_id': 'key_abc123'
+}
+# Keyword arguments start_verification passes to Session.request
+_EXPECTED_START_REQUEST = {
+    'method': 'POST',
+    'url': 'https://api.idswyft.com/api/verify/start',
+    'data': {'user_id': 'user-123', 'sandbox': True},
+    'files': None,
+    'params': None,
+    'headers': None,
+    'timeout': 30
+}
+
+class TestVerificationEndpoints:
+    """Test the verification and developer API methods against a mocked session"""
+    
+    def test_start_verification(self, mock_client):
+        """Test start verification method"""
+        mock_client.session.request.return_value = FakeResponse(_RESP_START_VERIFICATION)
+        
+        result = mock_client.client.start_verification(
+            user_id='user-123',
+            sandbox=True
+        )
+        
+        # Verify the API call
+        mock_client.session.request.assert_called_once()
+        assert mock_client.session.request.call_args.kwargs == _EXPECTED_START_REQUEST
+        
+        assert result == _RESP_START_VERIFICATION
+    
+    def test_base_url_path_prefix(self, mock_session):
+        """Test a path prefix on base_url is kept when building request URLs"""
+        mock_session.request.return_value = FakeResponse({'status': 'ok'})
+        
+        client = IdswyftClient(api_key='test-key', base_url='https://gateway.example.com/idswyft/')
+        client.health_check()
+        
+        call_kwargs = mock_session.request.call_args.kwargs
+        assert call_kwargs['url'] == 'https://gateway.example.com/idswyft/api/health'
+    
+    def test_verify_document_with_verification_id(self, mock_client):
+        """Test document verification with verification session ID"""
+        mock_client.session.request.return_value = FakeResponse(_RESP_VERIFY_DOC)
+        
+        test_bytes = b'fake image data'
+        result = mock_client.client.verify_document(
+            verification_id='verif_123',
+            document_type='passport',
+            document_file=test_bytes,
+            user_id='user-123'
+        )
+        
+        assert result == _RESP_VERIFY_DOC
+    
+    def test_verify_documents_bulk(self, mock_client):
+        """Test bulk verification returns one result per item, in order"""
+        def respond(**kwargs):
+            return FakeResponse({
+                'verification': {'id': kwargs['data']['user_id'], 'status': 'pending'}
+            })
+        
+        mock_client.session.request.side_effect = respond
+        
+        client = mock_client.client
+        
+        items = [
+            {'document_type': 'passport', 'document_file': b'fake image data', 'user_id': f'user-{i}'}
+            for i in range(5)
+        ]
+        results = client.verify_documents_bulk(items, max_workers=3)
+        
+        assert [r['id'] for r in results] == [f'user-{i}' for i in range(5)]
+        assert mock_client.session.request.call_count == 5
+    
+    @pytest.mark.slow
+    def test_verify_document_closes_path_handle(self, mock_client, tmp_path):
+        """Test a document given by path is streamed and closed after upload"""
+        mock_client.session.request.return_value = FakeResponse({'id': 'verif_123', 'status': 'pending'})
+        path = tmp_path / 'doc.png'
+        path.write_bytes(b'fake image data')
+        
+        client = mock_client.client
+        client.verify_document(document_type='passport', document_file=str(path))
+        
+        field_name, handle, content_type = mock_client.session.request.call_args.kwargs['files']['document']
+        assert content_type == 'image/png'
+        assert handle.closed
+    
+    @patch('idswyft.client.MultipartEncoder')
+    def test_verify_document_streams_multipart(self, mock_encoder_class, mock_client):
+        """Test uploads go through MultipartEncoder when requests-toolbelt is installed"""
+        mock_client.session.request.return_value = FakeResponse({'id': 'verif_123', 'status': 'pending'})
+        
+        mock_encoder = Mock()
+        mock_encoder.content_type = 'multipart/form-data; boundary=abc'
+        mock_encoder_class.return_value = mock_encoder
+        
+        client = mock_client.client
+        client.verify_document(document_type='passport', document_file=b'\xff\xd8\xff\xe0 fake jpeg')
+        
+        fields = dict(mock_encoder_class.call_args.kwargs['fields'])
+        assert fields['document_type'] == 'passport'
+        assert fields['document'][2] == 'image/jpeg'
+        
+        call_kwargs = mock_client.session.request.call_args.kwargs
+        assert call_kwargs['data'] is mock_encoder
+        assert call_kwargs['files'] is None
+        assert call_kwargs['headers']['Content-Type'] == 'multipart/form-data; boundary=abc'
+    
+    def test_verify_back_of_id(self, mock_client):
+        """Test back-of-ID verification"""
+        mock_client.session.request.return_value = FakeResponse(_RESP_VERIFY_BACK)
+        
+        test_bytes = b'fake back image data'
+        result = mock_client.client.verify_back_of_id(
+            verification_id='verif_123',
+            document_type='drivers_license',
+            back_of_id_file=test_bytes
+        )
+        
+        assert result == _RESP_VERIFY_BACK
+    
+    def test_live_capture(self, mock_client):
+        """Test live capture with AI liveness detection"""
+        mock_client.session.request.return_value = FakeResponse(_RESP_LIVE_CAPTURE)
+        
+        result = mock_client.client.live_capture(
+            verification_id='verif_123',
+            live_image_data='data:image/jpeg;base64,/9j/4AAQSkZJRgABA...',
+            challenge_response='smile'
+        )
+        
+        assert result == _RESP_LIVE_CAPTURE
+    
+    def test_live_capture_raw_bytes(self, mock_client):
+        """Test raw live images are uploaded as a file instead of base64"""
+        mock_client.session.request.return_value = FakeResponse({'id': 'verif_live123', 'status': 'pending'})
+        
+        jpeg_bytes = b'\xff\xd8\xff\xe0fake jpeg data'
+        mock_client.client.live_capture(verification_id='verif_123', live_image_data=jpeg_bytes)
+        
+        call_kwargs = mock_client.session.request.call_args.kwargs
+        assert call_kwargs['data'] == {'verification_id': 'verif_123'}
+        assert call_kwargs['files'] == {'live_image': ('live_image', jpeg_bytes, 'image/jpeg')}
+    
+    def test_generate_live_token(self, mock_client):
+        """Test live token generation"""
+        mock_client.session.request.return_value = FakeResponse(_RESP_LIVE_TOKEN)
+        
+        result = mock_client.client.generate_live_token(
+            verification_id='verif_123',
+            challenge_type='smile'
+        )
+        
+        assert result == _RESP_LIVE_TOKEN
+    
+    @patch.object(FakeResponse, 'json')
+    def test_list_verifications(self, mock_json, mock_client):
+        """Test listing verifications decodes the raw response body"""
+        mock_client.session.request.return_value = FakeResponse({
+            'verifications': [
+                {'id': 'verif_1', 'status': 'verified', 'type': 'document'},
+                {'id': 'verif_2', 'status': 'pending', 'type': 'selfie'}
+            ],
+            'total': 2,
+            'limit': 10,
+            'offset': 0
+        })
+        
+        result = mock_client.client.list_verifications(status='verified', limit=10)
+        
+        assert result['total'] == 2
+        assert result['verifications'][0]['id'] == 'verif_1'
+        mock_json.assert_not_called()
+    
+    def test_response_enum_fields_interned(self, mock_client):
+        """Test repeated status/type strings share one object across responses"""
+        def response():
+            return FakeResponse({
+                'verifications': [{'id': 'verif_1', 'status': 'manual_review', 'type': 'document'}],
+                'total': 1
+            })
+        
+        mock_client.session.request.side_effect = [response(), response()]
+        
+        client = mock_client.client
+        
+        first = client.list_verifications()['verifications'][0]
+        second = client.list_verifications()['verifications'][0]
+        
+        assert first['status'] is second['status']
+        assert first['type'] is second['type']
+    
+    def test_iter_verifications(self, mock_client):
+        """Test iterating verifications walks every page in order"""
+        def page(ids, offset):
+            return FakeResponse({
+                'verifications': [{'id': i, 'status': 'verified'} for i in ids],
+                'total': 5,
+                'limit': 2,
+                'offset': offset
+            })
+        
+        mock_client.session.request.side_effect = [
+            page(['verif_1', 'verif_2'], 0),
+            page(['verif_3', 'verif_4'], 2),
+            page(['verif_5'], 4),
+        ]
+        
+        client = mock_client.client
+        
+        ids = [v['id'] for v in client.iter_verifications(page_size=2)]
+        
+        assert ids == ['verif_1', 'verif_2', 'verif_3', 'verif_4', 'verif_5']
+        offsets = [c.kwargs['params'].get('offset') for c in mock_client.session.request.call_args_list]
+        assert offsets == [None, 2, 4]
+    
+    def test_iter_verifications_short_page_with_total(self, mock_client):
+        """Test a page shorter than page_size doesn't end iteration while total says more exist"""
+        mock_client.session.request.side_effect = [
+            FakeResponse({'verifications': [{'id': 'verif_1'}], 'total': 2}),
+            FakeResponse({'verifications': [{'id': 'verif_2'}], 'total': 2}),
+        ]
+        
+        ids = [v['id'] for v in mock_client.client.iter_verifications(page_size=5000)]
+        
+        assert ids == ['verif_1', 'verif_2']
+        limits = [c.kwargs['params']['limit'] for c in mock_client.session.request.call_args_list]
+        assert limits == [1000, 1000]
+    
+    def test_get_verification_status_cache_terminal(self, mock_client):
+        """Test cached status lookups skip the API once a verification is final"""
+        mock_client.session.request.return_value = FakeResponse({
+            'verification': {'id': 'verif_123', 'status': 'verified'}
+        })
+
+        client = mock_client.client
+
+        first = client.get_verification_status('verif_123', cache=True)
+        second = client.get_verification_status('verif_123', cache=True)
+
+        assert first['status'] == 'verified'
+        assert second is first
+        assert mock_client.session.request.call_count == 1
+    
+    @pytest.mark.parametrize('status', ['pending', 'manual_review'])
+    def test_get_verification_status_cache_pending(self, mock_client, status):
+        """Test undecided statuses are never served from the cache"""
+        mock_client.session.request.return_value = FakeResponse({
+            'verification': {'id': 'verif_123', 'status': status}
+        })
+
+        client = mock_client.client
+
+        client.get_verification_status('verif_123', cache=True)
+        client.get_verification_status('verif_123', cache=True)
+
+        assert mock_client.session.request.call_count == 2
+    
+    @patch('idswyft.client.random.uniform', return_value=0.5)
+    @patch('idswyft.client.time.sleep')
+    def test_wait_for_completion(self, mock_sleep, mock_uniform, mock_client):
+        """Test waiting backs off with jitter between checks and honours retry_after"""
+        mock_client.session.request.side_effect = [
+            FakeResponse({'verification': {'id': 'verif_123', 'status': 'pending'}}),
+            FakeResponse({'message': 'Rate limit exceeded', 'retry_after': 5}, status_code=429),
+            FakeResponse({'verification': {'id': 'verif_123', 'status': 'pending'}}),
+            FakeResponse({'verification': {'id': 'verif_123', 'status': 'verified'}}),
+        ]
+        
+        client = mock_client.client
+        result = client.wait_for_completion('verif_123', initial=1, factor=2)
+        
+        assert result['status'] == 'verified'
+        # retry_after is a floor under the jittered wait, not scaled by it
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.5, 5, 1]
+        mock_uniform.assert_called_with(0.5, 1.0)
+    
+    @patch('idswyft.client.time.sleep')
+    @patch('idswyft.client.time.monotonic')
+    def test_wait_for_completion_timeout(self, mock_monotonic, mock_sleep, mock_client):
+        """Test waiting gives up with IdswyftTimeoutError after the timeout"""
+        mock_client.session.request.return_value = FakeResponse({
+            'verification': {'id': 'verif_123', 'status': 'pending'}
+        })
+        mock_monotonic.side_effect = [0, 5, 11]
+        
+        client = mock_client.client
+        
+        with pytest.raises(IdswyftTimeoutError) as exc_info:
+            client.wait_for_completion('verif_123', timeout=10, initial=5)
+        
+        assert exc_info.value.verification_id == 'verif_123'
+        assert mock_client.session.request.call_count == 2
+    
+    @patch('idswyft.client.time.monotonic')
+    def test_get_response_cache_ttl(self, mock_monotonic, mock_session):
+        """Test GET responses are reused until cache_ttl expires"""
+        mock_session.request.return_value = FakeResponse({'api_keys': []}, headers={})
+        mock_monotonic.return_value = 100.0
+
+        client = IdswyftClient(api_key='test-key', cache_ttl=5)
+
+        client.list_api_keys()
+        mock_monotonic.return_value = 104.0
+        client.list_api_keys()
+        assert mock_session.request.call_count == 1
+
+        mock_monotonic.return_value = 106.0
+        client.list_api_keys()
+        assert mock_session.request.call_count == 2
+    
+    @pytest.mark.parametrize('status,expected_calls', [('verified', 1), ('manual_review', 2)])
+    @patch('idswyft.client.time.monotonic')
+    def test_get_response_cache_final_status(self, mock_monotonic, mock_session, status, expected_calls):
+        """Test only decided verifications outlive cache_ttl; manual reviews still expire"""
+        mock_session.request.return_value = FakeResponse(
+            {'verification': {'id': 'verif_123', 'status': status}}
+        )
+        mock_monotonic.return_value = 100.0
+
+        client = IdswyftClient(api_key='test-key', cache_ttl=5)
+
+        client.get_verification_status('verif_123')
+        mock_monotonic.return_value = 200.0
+        client.get_verification_status('verif_123')
+
+        assert mock_session.request.call_count == expected_calls
+    
+    @patch('idswyft.client.time.monotonic')
+    def test_get_revalidates_with_etag(self, mock_monotonic, mock_session):
+        """Test an expired cached GET sends If-None-Match and re-parses the body on 304"""
+        first_response = FakeResponse(
+            {'verification': {'id': 'verif_123', 'status': 'pending'}},
+            headers={'ETag': 'W/"abc123"'}
+        )
+        not_modified = FakeResponse(status_code=304, headers={})
+
+        mock_session.request.side_effect = [first_response, not_modified]
+        mock_monotonic.return_value = 100.0
+
+        client = IdswyftClient(api_key='test-key', cache_ttl=5)
+
+        first = client.get_verification_status('verif_123')
+        mock_monotonic.return_value = 106.0
+        second = client.get_verification_status('verif_123')
+
+        assert second == first
+        assert second is not first
+        assert mock_session.request.call_args_list[0].kwargs['headers'] is None
+        assert mock_session.request.call_args_list[1].kwargs['headers'] == {
+            'If-None-Match': 'W/"abc123"'
+        }
+    
+    def test_get_without_cache_ttl_keeps_no_etag(self, mock_client):
+        """Test ETags aren't stored or sent when caching is off"""
+        mock_client.session.request.return_value = FakeResponse(
+            {'verification': {'id': 'verif_123', 'status': 'pending'}},
+            headers={'ETag': 'W/"abc123"'}
+        )
+
+        mock_client.client.get_verification_status('verif_123')
+        mock_client.client.get_verification_status('verif_123')
+
+        assert [c.kwargs['headers'] for c in mock_client.session.request.call_args_list] == [None, None]
+        assert not mock_client.client._etags
+    
+    def test_get_response_cache_no_store(self, mock_session):
+        """Test responses marked Cache-Control: no-store are not cached"""
+        mock_session.request.return_value = FakeResponse({'webhooks': []}, headers={'Cache-Control': 'no-store'})
+
+        client = IdswyftClient(api_key='test-key', cache_ttl=60)
+
+        client.list_webhooks()
+        client.list_webhooks()
+
+        assert mock_session.request.call_count == 2
+    
+    def test_create_api_key(self, mock_client):
+        """Test API key creation"""
+        mock_client.session.request.return_value = FakeResponse(_RESP_API_KEY)
+        
+        result = mock_client.client.create_api_key(
+            name='Test Key',
+            environment='sandbox'
+        )
+        
+        assert result == _RESP_API_KEY
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])
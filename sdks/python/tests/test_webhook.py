@@ -0,0 +1,85 @@
+#!/usr/bin/env python3
+"""
+Webhook tests for Idswyft Python SDK
+"""
+
+import pytest
+import hmac
+import hashlib
+
+from idswyft import IdswyftClient
+
+from fakes import FakeResponse
+
+# Response body returned by the mocked API
+_RESP_WEBHOOK = {
+    'webhook': {
+        'id': 'hook_123',
+        'url': 'https://example.com/webhook',
+        'events': ['verification.completed'],
+        'is_active': True,
+        'secret': 'webhook_secret'
+    }
+}
+
+class TestWebhooks:
+    """Test webhook registration and signature verification"""
+    
+    def test_register_webhook(self, mock_client):
+        """Test webhook registration"""
+        mock_client.session.request.return_value = FakeResponse(_RESP_WEBHOOK)
+        
+        result = mock_client.client.register_webhook(
+            url='https://example.com/webhook',
+            events=['verification.completed'],
+            secret='webhook_secret'
+        )
+        
+        assert result == _RESP_WEBHOOK
+    
+    @pytest.mark.parametrize('sig_valid', [True, False])
+    def test_webhook_signature_verification(self, webhook_case, sig_valid):
+        """Test webhook signature verification"""
+        payload, valid_signature, secret = webhook_case
+        signature = valid_signature if sig_valid else 'invalid-signature'
+        payload_bytes = payload.encode('utf-8')
+        
+        is_valid = IdswyftClient.verify_webhook_signature(payload, signature, secret)
+        assert is_valid == sig_valid
+        
+        # Raw body bytes are accepted as-is
+        is_valid_bytes = IdswyftClient.verify_webhook_signature(
+            payload_bytes, signature, secret.encode('utf-8')
+        )
+        assert is_valid_bytes == sig_valid
+        
+        # Signature header as raw bytes
+        is_valid_header_bytes = IdswyftClient.verify_webhook_signature(
+            payload_bytes, signature.encode('ascii'), secret
+        )
+        assert is_valid_header_bytes == sig_valid
+        
+        # Test empty inputs
+        is_empty = IdswyftClient.verify_webhook_signature('', '', '')
+        assert is_empty == False
+    
+    def test_webhook_verifier_reuse(self):
+        """Test a reusable webhook verifier checks several payloads"""
+        secret = 'webhook-secret'
+        verifier = IdswyftClient.webhook_verifier(secret)
+        keyed = hmac.new(secret.encode('utf-8'), digestmod=hashlib.sha256)
+        
+        for payload in (b'{"status":"verified"}', '{"status":"failed"}'):
+            body = payload if isinstance(payload, bytes) else payload.encode('utf-8')
+            mac = keyed.copy()
+            mac.update(body)
+            signature = mac.hexdigest()
+            assert verifier.verify(payload, signature) == True
+            assert verifier.verify(payload, 'sha256=' + signature) == True
+        
+        assert verifier.verify(b'{"status":"verified"}', 'sha256=00') == False
+        assert verifier.verify(b'', 'sha256=00') == False
+
+
+if __name__ == '__main__':
+    pytest.main([__file__, '-v'])